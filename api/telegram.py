@@ -8,18 +8,35 @@ import requests
 import logging
 from utils.config import Config
 from utils.logging import get_logger
+from utils.http import SESSION, POLL_SESSION, DEFAULT_TIMEOUT, parse_json
 
 logger = get_logger(__name__)
 
-def send_telegram(message, chat_id, parse_mode="Markdown"):
+# Characters with special meaning in Telegram's legacy Markdown parse mode
+_MARKDOWN_ESCAPES = str.maketrans({'*': '\\*', '_': '\\_', '[': '\\[', ']': '\\]'})
+
+def escape_markdown(text):
     """
-    Send a message to a Telegram chat.
+    Escape text for use inside a Telegram Markdown message.
     
+    Args:
+        text (str): Raw text, e.g. a news headline
+        
+    Returns:
+        str: Text with Markdown control characters backslash-escaped
+    """
+    return text.translate(_MARKDOWN_ESCAPES) if text else ""
+
+def send_telegram(message, chat_id, parse_mode="Markdown", reply_markup=None):
+    """
+    Send a message to a Telegram chat.
+
     Args:
         message (str): The message to send
         chat_id (int/str): The Telegram chat ID to send to
         parse_mode (str): The parsing mode for the message text
-        
+        reply_markup (dict, optional): Inline keyboard or other reply markup
+
     Returns:
         dict: The response from the Telegram API, or None on error
     """
@@ -30,11 +47,13 @@ def send_telegram(message, chat_id, parse_mode="Markdown"):
             "text": message,
             "parse_mode": parse_mode
         }
-        
-        response = requests.post(url, json=payload)
+        if reply_markup:
+            payload["reply_markup"] = reply_markup
+
+        response = SESSION.post(url, json=payload, timeout=DEFAULT_TIMEOUT)
         response.raise_for_status()  # Raise exception for 4XX/5XX responses
         
-        data = response.json()
+        data = parse_json(response)
         if data.get("ok"):
             logger.debug(f"Message sent successfully to chat {chat_id}")
             return data
@@ -49,12 +68,20 @@ def send_telegram(message, chat_id, parse_mode="Markdown"):
         return None
 
 def send_telegram_with_markup(text, chat_id, reply_markup):
-    from telegram import Bot
-    import os
-    import asyncio
-    bot_token = os.getenv("TELEGRAM_BOT_TOKEN")
-    bot = Bot(token=bot_token)
-    asyncio.run(bot.send_message(chat_id=chat_id, text=text, reply_markup=reply_markup, parse_mode='Markdown'))
+    """
+    Send a Markdown message with an inline keyboard to a Telegram chat.
+
+    Args:
+        text (str): The message to send
+        chat_id (int/str): The Telegram chat ID to send to
+        reply_markup: telegram.InlineKeyboardMarkup or an equivalent dict
+
+    Returns:
+        dict: The response from the Telegram API, or None on error
+    """
+    if hasattr(reply_markup, "to_dict"):
+        reply_markup = reply_markup.to_dict()
+    return send_telegram(text, chat_id, reply_markup=reply_markup)
 
 def get_updates(offset=None, timeout=30):
     """
@@ -77,10 +104,11 @@ def get_updates(offset=None, timeout=30):
         if offset:
             payload["offset"] = offset
             
-        response = requests.post(url, json=payload)
+        # Telegram holds the request open for up to `timeout` seconds
+        response = POLL_SESSION.post(url, json=payload, timeout=(3, timeout + 5))
         response.raise_for_status()
         
-        data = response.json()
+        data = parse_json(response)
         if data.get("ok"):
             return data.get("result", [])
         else:
@@ -10,7 +10,7 @@ import time
 import logging
 import threading
 import argparse
-from dotenv import load_dotenv
+from functools import partial
 
 # Add project root to path for imports
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
@@ -28,6 +28,10 @@ from data_modules.models import (
     init_user_logs_db
 )
 from utils.time_utils import get_bd_now, should_send_news
+from utils.concurrency import run_concurrently
+
+# Maximum number of scheduled digests built and sent at the same time
+AUTO_NEWS_WORKERS = 8
 
 def run_bot():
     """Run the interactive Telegram bot."""
@@ -43,6 +47,23 @@ def run_bot():
         logger.error(f"Error running bot: {e}", exc_info=True)
         raise
 
+def deliver_digest(user, logger):
+    """Build and send one user's scheduled digest, logging any failure."""
+    try:
+        # Build personalized digest
+        digest = build_news_digest(user)
+        
+        # Send digest to user
+        chat_id = user.get("chat_id")
+        send_telegram(digest, chat_id)
+        
+        # Update last sent time
+        update_last_sent(user.get("user_id"))
+        
+        logger.info(f"Sent news digest to user {user.get('user_id')}")
+    except Exception as e:
+        logger.error(f"Error sending to user {user.get('user_id')}: {e}")
+
 def run_auto_news():
     """Run the automated news delivery service."""
     logger = get_logger("auto_news")
@@ -64,21 +85,12 @@ def run_auto_news():
                 
                 if users:
                     logger.info(f"Found {len(users)} users for scheduled time {current_time}")
-                    for user in users:
-                        try:
-                            # Build personalized digest
-                            digest = build_news_digest(user)
-                            
-                            # Send digest to user
-                            chat_id = user.get("chat_id")
-                            send_telegram(digest, chat_id)
-                            
-                            # Update last sent time
-                            update_last_sent(user.get("user_id"))
-                            
-                            logger.info(f"Sent news digest to user {user.get('user_id')}")
-                        except Exception as e:
-                            logger.error(f"Error sending to user {user.get('user_id')}: {e}")
+                    # Each user gets a single message, so different chats can be
+                    # served in parallel without tripping the per-chat rate limit
+                    run_concurrently(
+                        [(user.get("user_id"), partial(deliver_digest, user, logger)) for user in users],
+                        max_workers=min(AUTO_NEWS_WORKERS, len(users))
+                    )
                 
                 # Sleep for 1 minute
                 time.sleep(60)
@@ -95,9 +107,6 @@ def run_auto_news():
 
 def main():
     """Main entry point that parses command line arguments and starts the requested service."""
-    # Load environment variables
-    load_dotenv()
-    
     # Setup logging
     setup_logging("main")
     logger = get_logger("main")
@@ -5,19 +5,28 @@ This module fetches real-time breaking news, crypto data with AI analysis,
 and weather data while ensuring no duplicate news across time slots.
 """
 
-import requests
-import feedparser
 import json
 import os
 import sqlite3
 import time
 import re
 import hashlib
+import threading
 import pytz
+from bisect import bisect_left
 from datetime import datetime, timedelta
+from functools import lru_cache
 from utils.logging import get_logger
 from utils.config import Config
+from requests import RequestException
+from utils.http import SESSION, parse_json
+from utils.concurrency import run_concurrently, FEED_POOL
+from utils.cache import ttl_cache
+from api.telegram import escape_markdown
 from utils.time_utils import get_bd_now
+from data_modules.feed_cache import save_feed_cache
+from core.feed_parser import fetch_feed_entries
+from core.news_fetcher import get_holidays_on, change_arrow, to_float, uv_level, fetch_global_market_totals
 
 logger = get_logger(__name__)
 
@@ -27,40 +36,49 @@ _cache = {}
 _cache_duration = 300  # 5 minutes cache for most data
 _coingecko_cache_duration = 120  # 2 minutes for crypto data
 _rss_cache_duration = 180  # 3 minutes for RSS feeds
+_weather_cache_duration = 600  # 10 minutes for weather conditions
+_ai_analysis_cache_duration = 300  # 5 minutes for DeepSeek analyses of unchanged markets
+# Guards _cache and _last_request_times, which are shared by the fetch threads
+_cache_lock = threading.Lock()
 
 def _cleanup_cache():
     """Clean up expired cache entries to prevent memory buildup."""
     current_time = time.time()
     expired_keys = []
     
-    for key, (_, cached_time) in _cache.items():
-        if current_time - cached_time > _cache_duration * 2:  # Clean up items older than 2x cache duration
-            expired_keys.append(key)
-    
-    for key in expired_keys:
-        del _cache[key]
+    with _cache_lock:
+        for key, (_, cached_time) in _cache.items():
+            if current_time - cached_time > _cache_duration * 2:  # Clean up items older than 2x cache duration
+                expired_keys.append(key)
+        
+        for key in expired_keys:
+            del _cache[key]
     
     if expired_keys:
         logger.debug(f"Cleaned up {len(expired_keys)} expired cache entries")
 
+def _wait_for_request_slot(domain, min_interval):
+    """
+    Wait until a request to a domain is at least min_interval after the previous one.
+
+    The slot is claimed under the lock before sleeping, so concurrent callers
+    queue up one interval apart instead of all seeing the same old timestamp.
+    """
+    with _cache_lock:
+        now = time.time()
+        slot = max(now, _last_request_times.get(domain, 0) + min_interval)
+        _last_request_times[domain] = slot
+    if slot > now:
+        logger.debug(f"Rate limiting: sleeping {slot - now:.2f}s for {domain}")
+        time.sleep(slot - now)
+
 def _rate_limited_post(url, min_interval=1.0, timeout=10, **kwargs):
     """Make a rate-limited HTTP POST request."""
-    current_time = time.time()
-    
     # Rate limiting
     domain = url.split('/')[2]  # Extract domain for per-domain rate limiting
-    last_request = _last_request_times.get(domain, 0)
-    time_since_last = current_time - last_request
-    
-    if time_since_last < min_interval:
-        sleep_time = min_interval - time_since_last
-        logger.debug(f"Rate limiting POST: sleeping {sleep_time:.2f}s for {domain}")
-        time.sleep(sleep_time)
+    _wait_for_request_slot(domain, min_interval)
     
     try:
-        # Update last request time
-        _last_request_times[domain] = time.time()
-        
         # Make POST request with proper headers
         headers = kwargs.get('headers', {})
         headers.update({
@@ -70,15 +88,15 @@ def _rate_limited_post(url, min_interval=1.0, timeout=10, **kwargs):
         })
         kwargs['headers'] = headers
         
-        response = requests.post(url, timeout=timeout, **kwargs)
+        response = SESSION.post(url, timeout=timeout, **kwargs)
         return response
         
     except Exception as e:
         logger.error(f"Rate limited POST request failed for {url}: {e}")
         raise
 
-def _rate_limited_request(url, min_interval=1.0, timeout=10, **kwargs):
-    """Make a rate-limited HTTP request with caching."""
+def _rate_limited_request(url, min_interval=1.0, timeout=10, cache_seconds=None, **kwargs):
+    """Make a rate-limited HTTP request with caching (cache_seconds overrides the default TTL)."""
     current_time = time.time()
     
     # Periodic cache cleanup
@@ -87,27 +105,20 @@ def _rate_limited_request(url, min_interval=1.0, timeout=10, **kwargs):
     
     # Check cache first
     cache_key = f"{url}_{hash(str(sorted(kwargs.items())))}"
-    if cache_key in _cache:
-        cached_data, cached_time = _cache[cache_key]
-        cache_duration = _coingecko_cache_duration if 'coingecko.com' in url else _cache_duration
+    with _cache_lock:
+        cached = _cache.get(cache_key)
+    if cached:
+        cached_data, cached_time = cached
+        cache_duration = cache_seconds or (_coingecko_cache_duration if 'coingecko.com' in url else _cache_duration)
         if current_time - cached_time < cache_duration:
             logger.debug(f"Using cached data for {url}")
             return cached_data
     
     # Rate limiting
     domain = url.split('/')[2]  # Extract domain for per-domain rate limiting
-    last_request = _last_request_times.get(domain, 0)
-    time_since_last = current_time - last_request
-    
-    if time_since_last < min_interval:
-        sleep_time = min_interval - time_since_last
-        logger.debug(f"Rate limiting: sleeping {sleep_time:.2f}s for {domain}")
-        time.sleep(sleep_time)
+    _wait_for_request_slot(domain, min_interval)
     
     try:
-        # Update last request time
-        _last_request_times[domain] = time.time()
-        
         # Make request with proper headers to reduce 429 errors
         headers = kwargs.get('headers', {})
         headers.update({
@@ -118,21 +129,22 @@ def _rate_limited_request(url, min_interval=1.0, timeout=10, **kwargs):
         })
         kwargs['headers'] = headers
         
-        response = requests.get(url, timeout=timeout, **kwargs)
+        response = SESSION.get(url, timeout=timeout, **kwargs)
         
         # Handle rate limiting responses specifically
         if response.status_code == 429:
             logger.warning(f"Rate limited by {domain}, waiting 10 seconds...")
             time.sleep(10)
-            # Update rate limit for this domain
-            _last_request_times[domain] = time.time()
-            # Try one more time with longer interval
-            time.sleep(min_interval * 2)
-            response = requests.get(url, timeout=timeout, **kwargs)
+            # Restart the interval for this domain and retry after twice as long
+            with _cache_lock:
+                _last_request_times[domain] = time.time()
+            _wait_for_request_slot(domain, min_interval * 2)
+            response = SESSION.get(url, timeout=timeout, **kwargs)
         
         # Cache successful responses
         if response.status_code == 200:
-            _cache[cache_key] = (response, current_time)
+            with _cache_lock:
+                _cache[cache_key] = (response, current_time)
         
         return response
         
@@ -162,9 +174,13 @@ def init_news_history_db():
             url TEXT
         )
     ''')
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_news_history_sent_time ON news_history (sent_time)')
     
     conn.commit()
     conn.close()
+    
+    # Keep lookups and the file size bounded between runs
+    cleanup_old_news_history()
 
 def get_news_hash(title, source):
     """Generate a unique hash for news item to track duplicates."""
@@ -193,15 +209,28 @@ def is_news_already_sent(news_hash, hours_back=6):
 
 def mark_news_as_sent(news_hash, title, source, published_time, category, url=""):
     """Mark news as sent to prevent future duplicates."""
+    mark_news_batch_as_sent([(news_hash, title, source, published_time, category, url)])
+
+def mark_news_batch_as_sent(items):
+    """
+    Mark several news items as sent in a single transaction.
+    
+    Args:
+        items (list): Tuples of (news_hash, title, source, published_time, category, url)
+    """
+    if not items:
+        return
     try:
+        sent_time = datetime.now().isoformat()
         conn = sqlite3.connect(NEWS_DB_PATH)
         cursor = conn.cursor()
         
-        cursor.execute('''
+        cursor.executemany('''
             INSERT OR REPLACE INTO news_history 
             (news_hash, title, source, published_time, sent_time, category, url)
             VALUES (?, ?, ?, ?, ?, ?, ?)
-        ''', (news_hash, title, source, published_time, datetime.now().isoformat(), category, url))
+        ''', [(news_hash, title, source, published_time, sent_time, category, url)
+              for news_hash, title, source, published_time, category, url in items])
         
         conn.commit()
         conn.close()
@@ -225,40 +254,39 @@ def cleanup_old_news_history(days_back=7):
     except Exception as e:
         logger.error(f"Error cleaning up news history: {e}")
 
-def get_hours_ago(published_time_str):
-    """Calculate accurate hours ago from published time string."""
-    if not published_time_str or published_time_str.strip() == "":
-        return "recent"  # Changed from "Unknown" to "recent"
-    
+@lru_cache(maxsize=4096)
+def _parse_published_time(time_str):
+    """Parse an RSS timestamp string into a naive datetime (memoized), or None if unknown."""
+    pub_time = None
     try:
         # Parse various date formats commonly found in RSS feeds
-        if "GMT" in published_time_str or "UTC" in published_time_str:
+        if "GMT" in time_str or "UTC" in time_str:
             # Handle RFC 822 format: "Mon, 25 Nov 2024 14:30:00 GMT"
-            clean_time = published_time_str.replace("GMT", "").replace("UTC", "").strip()
+            clean_time = time_str.replace("GMT", "").replace("UTC", "").strip()
             pub_time = datetime.strptime(clean_time, "%a, %d %b %Y %H:%M:%S")
-        elif published_time_str.count(',') == 1 and any(month in published_time_str for month in ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec']):
+        elif time_str.count(',') == 1 and any(month in time_str for month in ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec']):
             # Handle RFC 822 format without timezone: "Mon, 25 Nov 2024 14:30:00"
-            pub_time = datetime.strptime(published_time_str.strip(), "%a, %d %b %Y %H:%M:%S")
-        elif "T" in published_time_str:
+            pub_time = datetime.strptime(time_str.strip(), "%a, %d %b %Y %H:%M:%S")
+        elif "T" in time_str:
             # Handle ISO format: "2024-11-25T14:30:00Z" or "2024-11-25T14:30:00"
-            if published_time_str.endswith('Z'):
-                pub_time = datetime.strptime(published_time_str[:-1], "%Y-%m-%dT%H:%M:%S")
-            elif '+' in published_time_str or '-' in published_time_str[-6:]:
+            if time_str.endswith('Z'):
+                pub_time = datetime.strptime(time_str[:-1], "%Y-%m-%dT%H:%M:%S")
+            elif '+' in time_str or '-' in time_str[-6:]:
                 # Handle timezone offset like +05:30 or -0800
-                if '+' in published_time_str:
-                    pub_time = datetime.strptime(published_time_str.split('+')[0], "%Y-%m-%dT%H:%M:%S")
+                if '+' in time_str:
+                    pub_time = datetime.strptime(time_str.split('+')[0], "%Y-%m-%dT%H:%M:%S")
                 else:
                     # Find the last dash that's part of timezone
-                    parts = published_time_str.rsplit('-', 1)
+                    parts = time_str.rsplit('-', 1)
                     if len(parts) == 2 and len(parts[1]) in [4, 5]:  # timezone like -0800 or -08:00
                         pub_time = datetime.strptime(parts[0], "%Y-%m-%dT%H:%M:%S")
                     else:
-                        pub_time = datetime.strptime(published_time_str[:19], "%Y-%m-%dT%H:%M:%S")
+                        pub_time = datetime.strptime(time_str[:19], "%Y-%m-%dT%H:%M:%S")
             else:
-                pub_time = datetime.strptime(published_time_str[:19], "%Y-%m-%dT%H:%M:%S")
-        elif published_time_str.count('-') == 2 and published_time_str.count(':') == 2:
+                pub_time = datetime.strptime(time_str[:19], "%Y-%m-%dT%H:%M:%S")
+        elif time_str.count('-') == 2 and time_str.count(':') == 2:
             # Handle format like "2024-11-25 14:30:00"
-            pub_time = datetime.strptime(published_time_str[:19], "%Y-%m-%d %H:%M:%S")
+            pub_time = datetime.strptime(time_str[:19], "%Y-%m-%d %H:%M:%S")
         else:
             # Try to parse other common formats
             formats_to_try = [
@@ -271,14 +299,24 @@ def get_hours_ago(published_time_str):
             pub_time = None
             for fmt in formats_to_try:
                 try:
-                    pub_time = datetime.strptime(published_time_str.strip()[:19], fmt)
+                    pub_time = datetime.strptime(time_str.strip()[:19], fmt)
                     break
                 except ValueError:
                     continue
-            
-            if pub_time is None:
-                logger.debug(f"Could not parse time format: '{published_time_str}'")
-                return "recent"  # Changed from "Unknown" to "recent"
+    except ValueError:
+        pass
+    return pub_time
+
+def get_hours_ago(published_time_str):
+    """Calculate accurate hours ago from published time string."""
+    if not published_time_str or published_time_str.strip() == "":
+        return "recent"  # Changed from "Unknown" to "recent"
+    
+    try:
+        pub_time = _parse_published_time(published_time_str)
+        if pub_time is None:
+            logger.debug(f"Could not parse time format: '{published_time_str}'")
+            return "recent"  # Changed from "Unknown" to "recent"
         
         # Calculate time difference
         now = datetime.now()
@@ -318,6 +356,49 @@ def get_hours_ago(published_time_str):
         logger.debug(f"Error parsing time '{published_time_str}': {e}")
         return "recent"  # Changed from "Unknown" to "recent"
 
+# Source credibility weight used by calculate_news_importance_score
+SOURCE_WEIGHTS = {
+    # Local sources
+    'Prothom Alo': 10, 'The Daily Star': 9, 'BDNews24': 8, 'Dhaka Tribune': 7,
+    'Financial Express': 8, 'New Age': 6, 'Kaler Kantho': 6,
+    # Global sources
+    'BBC': 10, 'Reuters': 10, 'CNN': 8, 'Al Jazeera': 8, 'Associated Press': 9,
+    'The Guardian': 8, 'NBC News': 7, 'Sky News': 7, 'New York Post': 6,
+    # Tech sources
+    'TechCrunch': 10, 'The Verge': 9, 'Ars Technica': 8, 'Wired': 8,
+    'VentureBeat': 7, 'Engadget': 7, 'ZDNet': 6, 'Mashable': 6,
+    # Sports sources
+    'ESPN': 10, 'BBC Sport': 9, 'Sports Illustrated': 8, 'Yahoo Sports': 7,
+    'Fox Sports': 7, 'CBS Sports': 7, 'Sky Sports': 8,
+    # Crypto sources
+    'Cointelegraph': 8, 'CoinDesk': 9, 'Decrypt': 7, 'The Block': 8,
+    'Bitcoin Magazine': 7, 'CryptoSlate': 6, 'NewsBTC': 6
+}
+
+# Breaking news keywords, each one found in a title adds 5 points
+BREAKING_KEYWORDS = ('breaking', 'urgent', 'alert', 'emergency', 'crisis', 'live',
+                     'developing', 'update', 'latest', 'just in', 'confirmed',
+                     'exclusive', 'major', 'significant', 'important', 'critical')
+
+def _keyword_pattern(words):
+    """Compile a substring matcher that hits when any of the words occurs."""
+    return re.compile('|'.join(map(re.escape, words)))
+
+# High-impact keyword groups: (matcher, score added if any word occurs)
+IMPACT_KEYWORD_SCORES = (
+    (_keyword_pattern(['death', 'killed', 'murder', 'accident', 'disaster',
+                       'earthquake', 'flood', 'fire', 'explosion', 'crash']), 8),
+    (_keyword_pattern(['election', 'government', 'minister', 'president',
+                       'prime minister', 'parliament', 'court', 'verdict']), 7),
+    (_keyword_pattern(['bitcoin', 'crypto', 'blockchain', 'ethereum',
+                       'market crash', 'surge', 'rally', 'all-time high']), 6),
+    (_keyword_pattern(['war', 'conflict', 'attack', 'bombing', 'invasion',
+                       'ceasefire', 'peace', 'treaty']), 9),
+    # Technology impact keywords
+    (_keyword_pattern(['ai', 'artificial intelligence', 'chatgpt', 'openai',
+                       'launch', 'release', 'breakthrough', 'innovation']), 5),
+)
+
 def calculate_news_importance_score(entry, source_name, feed_position):
     """Calculate importance score for news entry based on multiple factors."""
     score = 0
@@ -328,57 +409,22 @@ def calculate_news_importance_score(entry, source_name, feed_position):
     score += position_score
     
     # Source credibility weight
-    source_weights = {
-        # Local sources
-        'Prothom Alo': 10, 'The Daily Star': 9, 'BDNews24': 8, 'Dhaka Tribune': 7,
-        'Financial Express': 8, 'New Age': 6, 'Kaler Kantho': 6,
-        # Global sources
-        'BBC': 10, 'Reuters': 10, 'CNN': 8, 'Al Jazeera': 8, 'Associated Press': 9,
-        'The Guardian': 8, 'NBC News': 7, 'Sky News': 7, 'New York Post': 6,
-        # Tech sources
-        'TechCrunch': 10, 'The Verge': 9, 'Ars Technica': 8, 'Wired': 8,
-        'VentureBeat': 7, 'Engadget': 7, 'ZDNet': 6, 'Mashable': 6,
-        # Sports sources
-        'ESPN': 10, 'BBC Sport': 9, 'Sports Illustrated': 8, 'Yahoo Sports': 7,
-        'Fox Sports': 7, 'CBS Sports': 7, 'Sky Sports': 8,
-        # Crypto sources
-        'Cointelegraph': 8, 'CoinDesk': 9, 'Decrypt': 7, 'The Block': 8,
-        'Bitcoin Magazine': 7, 'CryptoSlate': 6, 'NewsBTC': 6
-    }
-    score += source_weights.get(source_name, 5)  # Default weight 5
+    score += SOURCE_WEIGHTS.get(source_name, 5)  # Default weight 5
     
     # Breaking news keywords
-    breaking_keywords = ['breaking', 'urgent', 'alert', 'emergency', 'crisis', 'live', 
-                        'developing', 'update', 'latest', 'just in', 'confirmed',
-                        'exclusive', 'major', 'significant', 'important', 'critical']
-    for keyword in breaking_keywords:
-        if keyword in title:
-            score += 5
+    score += 5 * sum(1 for keyword in BREAKING_KEYWORDS if keyword in title)
     
     # High-impact keywords by category
-    if any(word in title for word in ['death', 'killed', 'murder', 'accident', 'disaster', 
-                                     'earthquake', 'flood', 'fire', 'explosion', 'crash']):
-        score += 8
-    
-    if any(word in title for word in ['election', 'government', 'minister', 'president', 
-                                     'prime minister', 'parliament', 'court', 'verdict']):
-        score += 7
-    
-    if any(word in title for word in ['bitcoin', 'crypto', 'blockchain', 'ethereum', 
-                                     'market crash', 'surge', 'rally', 'all-time high']):
-        score += 6
-    
-    if any(word in title for word in ['war', 'conflict', 'attack', 'bombing', 'invasion', 
-                                     'ceasefire', 'peace', 'treaty']):
-        score += 9
-    
-    # Technology impact keywords
-    if any(word in title for word in ['ai', 'artificial intelligence', 'chatgpt', 'openai',
-                                     'launch', 'release', 'breakthrough', 'innovation']):
-        score += 5
+    for pattern, keyword_score in IMPACT_KEYWORD_SCORES:
+        if pattern.search(title):
+            score += keyword_score
     
     return score
 
+# Feed titles sometimes carry inline HTML and stray line breaks
+HTML_TAG_RE = re.compile(r'<[^>]+>')
+WHITESPACE_RE = re.compile(r'\s+')
+
 def fetch_breaking_news_rss(sources, limit=25, category="news", target_count=5):
     """Fetch breaking news from RSS sources with smart filtering and source distribution."""
     all_entries = []
@@ -386,31 +432,29 @@ def fetch_breaking_news_rss(sources, limit=25, category="news", target_count=5):
     source_count = {}  # Track how many articles per source
     debug_titles = []
     
-    for source_name, rss_url in sources.items():
+    # Download every feed at once; entries are still processed in source order
+    futures = {
+        source_name: FEED_POOL.submit(fetch_feed_entries, rss_url)
+        for source_name, rss_url in sources.items()
+    }
+    for source_name in sources:
         try:
             logger.debug(f"Fetching breaking news from {source_name}")
-            # Use rate-limited request with longer interval for RSS feeds
-            response = _rate_limited_request(
-                rss_url, 
-                min_interval=2.0,  # 2 second interval between RSS requests
-                timeout=15
-            )
-            response.raise_for_status()
-            feed = feedparser.parse(response.content)
-            if not feed.entries:
+            feed_entries = futures[source_name].result()
+            if not feed_entries:
                 logger.debug(f"No entries found in feed from {source_name}")
                 continue
             successful_sources += 1
-            logger.debug(f"Successfully fetched {len(feed.entries)} entries from {source_name}")
+            logger.debug(f"Successfully fetched {len(feed_entries)} entries from {source_name}")
             source_articles = 0  # Count articles from this source
-            for position, entry in enumerate(feed.entries[:limit]):
+            for position, entry in enumerate(feed_entries[:limit]):
                 try:
                     title = entry.get('title', '').strip()
                     if not title:
                         continue
                     # Clean HTML tags and image references from title
-                    title = re.sub(r'<[^>]+>', '', title)
-                    title = re.sub(r'\s+', ' ', title)
+                    title = HTML_TAG_RE.sub('', title)
+                    title = WHITESPACE_RE.sub(' ', title)
                     title = title.strip()
                     # Log every title for debug
                     debug_titles.append(f"{source_name}: {title}")
@@ -488,6 +532,7 @@ def fetch_breaking_news_rss(sources, limit=25, category="news", target_count=5):
             continue
             continue
     
+    save_feed_cache()
     success_rate = (successful_sources / len(sources)) * 100 if sources else 0
     logger.info(f"Fetched {len(all_entries)} total entries from {successful_sources}/{len(sources)} sources for {category} ({success_rate:.1f}% success)")
     logger.debug(f"Source distribution: {source_count}")
@@ -503,17 +548,18 @@ def fetch_breaking_news_rss(sources, limit=25, category="news", target_count=5):
             final_entries.append(entry)
             used_sources[source] = used_sources.get(source, 0) + 1
     if len(final_entries) < target_count:
-        remaining_entries = [e for e in all_entries if e not in final_entries]
+        picked_hashes = {e['hash'] for e in final_entries}
+        remaining_entries = [e for e in all_entries if e['hash'] not in picked_hashes]
         remaining_entries.sort(key=lambda x: x['total_score'], reverse=True)
-        while len(final_entries) < target_count and remaining_entries:
-            final_entries.append(remaining_entries.pop(0))
+        final_entries.extend(remaining_entries[:target_count - len(final_entries)])
     logger.info(f"Selected {len(final_entries)} entries for {category} with source diversity")
     return final_entries
 
 def format_news_section(section_title, entries, limit=5):
     """Format news entries prioritizing importance and recency, ensuring exactly 5 items."""
-    formatted = f"{section_title}:\n"
+    parts = [f"{section_title}:\n"]
     count = 0
+    sent_items = []
     # Sort entries by total score to get the most important ones first
     if entries:
         entries = sorted(entries, key=lambda x: x.get('total_score', 0), reverse=True)
@@ -528,19 +574,19 @@ def format_news_section(section_title, entries, limit=5):
         if not title:
             continue
         # Escape markdown characters in title
-        title_escaped = title.replace('*', '\\*').replace('_', '\\_').replace('[', '\\[').replace(']', '\\]')
+        title_escaped = escape_markdown(title)
         count += 1
         # Numbered format with clickable links (compact)
         if link:
-            formatted += f"{count}. [{title_escaped}]({link}) - {source} ({time_ago})\n"
+            parts.append(f"{count}. [{title_escaped}]({link}) - {source} ({time_ago})\n")
         else:
-            formatted += f"{count}. {title_escaped} - {source} ({time_ago})\n"
-        try:
-            mark_news_as_sent(entry['hash'], title, source, entry.get('published', ''), entry.get('category', ''), link)
-        except Exception as e:
-            logger.debug(f"Error marking news as sent: {e}")
+            parts.append(f"{count}. {title_escaped} - {source} ({time_ago})\n")
+        if 'hash' in entry:
+            sent_items.append((entry['hash'], title, source, entry.get('published', ''), entry.get('category', ''), link))
+    mark_news_batch_as_sent(sent_items)
     # If not enough real news, just leave blank (no fallback)
-    return formatted + ("\n" if count > 0 else "\n")
+    parts.append("\n")
+    return "".join(parts)
 
 # ===================== NEWS SOURCES =====================
 
@@ -650,32 +696,29 @@ def get_breaking_crypto_news():
 def fetch_crypto_market_with_ai():
     """Fetch crypto market data with comprehensive formatting for the news digest."""
     try:
-        # Fetch market overview with rate limiting
-        url = "https://api.coingecko.com/api/v3/global"
-        response = _rate_limited_request(url, min_interval=1.5, timeout=15)
-        response.raise_for_status()
-        
-        data = response.json()["data"]
-        market_cap = data["total_market_cap"]["usd"]
-        volume = data["total_volume"]["usd"]
-        market_change = data["market_cap_change_percentage_24h_usd"]
+        # Fetch market overview, shared with the other crypto sections
+        totals = fetch_global_market_totals()
+        market_cap = totals["market_cap"]
+        volume = totals["volume"]
+        market_change = totals["market_change"]
         
         # Get volume change (if available, otherwise estimate as same as market cap change)
         volume_change = market_change  # API doesn't provide volume change, use market change as approximation
         
         # Format market cap and volume with arrows
-        market_cap_str = f"${market_cap/1e12:.2f}T" if market_cap >= 1e12 else f"${market_cap/1e9:.2f}B"
-        volume_str = f"${volume/1e12:.2f}T" if volume >= 1e12 else f"${volume/1e9:.2f}B"
+        market_cap_str = _format_market_total(market_cap)
+        volume_str = _format_market_total(volume)
         
         # Add arrows for market cap and volume
-        market_arrow = "▲" if market_change > 0 else "▼" if market_change < 0 else "→"
-        volume_arrow = "▲" if volume_change > 0 else "▼" if volume_change < 0 else "→"
+        market_arrow = change_arrow(market_change)
+        volume_arrow = change_arrow(volume_change)
         
         # Fetch Fear & Greed Index with rate limiting
         try:
             fear_response = _rate_limited_request("https://api.alternative.me/fng/?limit=1", min_interval=1.0, timeout=10)
-            fear_index = fear_response.json()["data"][0]["value"]
-            fear_text = fear_response.json()["data"][0]["value_classification"]
+            fear_data = parse_json(fear_response)["data"][0]
+            fear_index = fear_data["value"]
+            fear_text = fear_data["value_classification"]
         except:
             fear_index = "N/A"
             fear_text = "Unknown"
@@ -706,29 +749,23 @@ Fear/Greed: {fear_greed_text}
         logger.error(f"Error fetching crypto market data: {e}")
         return "💰 CRYPTO MARKET STATUS\nMarket data temporarily unavailable.\n"
 
-def get_crypto_ai_analysis(market_data):
-    """Get AI analysis of crypto market using DeepSeek API."""
-    try:
-        api_key = Config.DEEPSEEK_API
-        if not api_key:
-            return "AI analysis unavailable (API key not configured)."
-        
-        # Prepare prompt for DeepSeek
-        top_cryptos_info = []
-        for crypto in market_data["top_cryptos"][:5]:
-            name = crypto.get("name", "")
-            price = crypto.get("current_price", 0)
-            change = crypto.get("price_change_percentage_24h", 0)
-            top_cryptos_info.append(f"{name}: ${price:.2f} ({change:+.2f}%)")
-        
-        prompt = f"""Analyze the current cryptocurrency market:
+def _market_analysis_key(market_data, api_key):
+    """Round the market inputs so analyses are only re-requested on meaningful moves."""
+    return (
+        round(market_data['market_cap'], -9),
+        round(market_data['market_change'], 1),
+        round(market_data['volume'], -9),
+        market_data['fear_greed'],
+    )
 
-Market Cap: ${market_data['market_cap']/1e12:.2f}T ({market_data['market_change']:+.2f}%)
-24h Volume: ${market_data['volume']/1e9:.2f}B
-Fear & Greed Index: {market_data['fear_greed']}/100
+_MARKET_ANALYSIS_PROMPT = """Analyze the current cryptocurrency market:
+
+Market Cap: ${market_cap_t:.2f}T ({market_change:+.2f}%)
+24h Volume: ${volume_b:.2f}B
+Fear & Greed Index: {fear_greed}/100
 
 Top 5 Cryptocurrencies:
-{chr(10).join(top_cryptos_info)}
+{top_cryptos}
 
 Provide a concise 2-3 sentence market analysis focusing on:
 1. Overall market sentiment and trend direction
@@ -738,38 +775,65 @@ Provide a concise 2-3 sentence market analysis focusing on:
 Keep it under 250 characters and end with prediction like: "Prediction (Next 24h): BULLISH 📈" or "BEARISH 📉" or "CONSOLIDATION 🤔"
 """
 
-        headers = {
-            "Authorization": f"Bearer {api_key}",
-            "Content-Type": "application/json"
-        }
-        
-        payload = {
-            "model": "deepseek-chat",
-            "messages": [
-                {
-                    "role": "user",
-                    "content": prompt
-                }
-            ],
-            "max_tokens": 150,
-            "temperature": 0.7
-        }
-        
-        response = _rate_limited_post(
-            "https://api.deepseek.com/chat/completions",
-            min_interval=2.0,
-            headers=headers,
-            json=payload,
-            timeout=15
-        )
+def _deepseek_chat(prompt, api_key, max_tokens):
+    """Send a single-message chat completion to DeepSeek and return the reply text."""
+    headers = {
+        "Authorization": f"Bearer {api_key}",
+        "Content-Type": "application/json"
+    }
+    
+    payload = {
+        "model": "deepseek-chat",
+        "messages": [
+            {
+                "role": "user",
+                "content": prompt
+            }
+        ],
+        "max_tokens": max_tokens,
+        "temperature": 0.7
+    }
+    
+    response = _rate_limited_post(
+        "https://api.deepseek.com/chat/completions",
+        min_interval=2.0,
+        headers=headers,
+        json=payload,
+        timeout=15
+    )
+    
+    response.raise_for_status()
+    result = parse_json(response)
+    return result["choices"][0]["message"]["content"].strip()
+
+@ttl_cache(seconds=_ai_analysis_cache_duration, key=_market_analysis_key)
+def _request_crypto_ai_analysis(market_data, api_key):
+    """Ask DeepSeek for a market analysis; raises on API errors so failures are not cached."""
+    # Prepare prompt for DeepSeek
+    top_cryptos_info = []
+    for crypto in market_data["top_cryptos"][:5]:
+        name = crypto.get("name", "")
+        price = crypto.get("current_price", 0)
+        change = crypto.get("price_change_percentage_24h", 0)
+        top_cryptos_info.append(f"{name}: ${price:.2f} ({change:+.2f}%)")
+    
+    prompt = _MARKET_ANALYSIS_PROMPT.format(
+        market_cap_t=market_data['market_cap'] / 1e12,
+        market_change=market_data['market_change'],
+        volume_b=market_data['volume'] / 1e9,
+        fear_greed=market_data['fear_greed'],
+        top_cryptos="\n".join(top_cryptos_info),
+    )
+    return _deepseek_chat(prompt, api_key, max_tokens=150)
+
+def get_crypto_ai_analysis(market_data):
+    """Get AI analysis of crypto market using DeepSeek API."""
+    try:
+        api_key = Config.DEEPSEEK_API
+        if not api_key:
+            return "AI analysis unavailable (API key not configured)."
         
-        if response.status_code == 200:
-            result = response.json()
-            analysis = result["choices"][0]["message"]["content"].strip()
-            return analysis
-        else:
-            logger.error(f"DeepSeek API error: {response.status_code}")
-            return "AI analysis temporarily unavailable."
+        return _request_crypto_ai_analysis(market_data, api_key)
             
     except Exception as e:
         logger.error(f"Error getting AI analysis: {e}")
@@ -785,7 +849,7 @@ def get_coingecko_coin_id(symbol):
         response = _rate_limited_request(search_url, min_interval=1.0, timeout=15, params=params)
         response.raise_for_status()
         
-        data = response.json()
+        data = parse_json(response)
         coins = data.get("coins", [])
         
         # Look for exact symbol match first
@@ -825,6 +889,18 @@ def format_crypto_price(price):
     else:
         return f"${price:.8f}"
 
+def _human_usd(value, decimals=2):
+    """Format a coin's market cap or volume as $B / $M, or whole dollars below a million."""
+    if value >= 1e9:
+        return f"${value/1e9:.{decimals}f}B"
+    elif value >= 1e6:
+        return f"${value/1e6:.{decimals}f}M"
+    return f"${value:.0f}"
+
+def _format_market_total(value):
+    """Format a whole-market total (cap or volume) as $T, or $B below a trillion."""
+    return f"${value/1e12:.2f}T" if value >= 1e12 else f"${value/1e9:.2f}B"
+
 def get_individual_crypto_stats(symbol):
     """Get detailed crypto stats with dynamic CoinGecko lookup for any coin."""
     try:
@@ -847,7 +923,7 @@ def get_individual_crypto_stats(symbol):
         response = _rate_limited_request(url, min_interval=1.5, timeout=15, params=params)
         response.raise_for_status()
         
-        data = response.json()
+        data = parse_json(response)
         market_data = data.get("market_data", {})
         
         # Extract key metrics
@@ -871,27 +947,17 @@ def get_individual_crypto_stats(symbol):
         price_str = format_crypto_price(current_price)
         
         # Format market cap
-        if market_cap >= 1e9:
-            mcap_str = f"${market_cap/1e9:.1f}B"
-        elif market_cap >= 1e6:
-            mcap_str = f"${market_cap/1e6:.1f}M"
-        else:
-            mcap_str = f"${market_cap:.0f}"
+        mcap_str = _human_usd(market_cap, 1)
         
         # Format volume
-        if volume_24h >= 1e9:
-            vol_str = f"${volume_24h/1e9:.1f}B"
-        elif volume_24h >= 1e6:
-            vol_str = f"${volume_24h/1e6:.1f}M"
-        else:
-            vol_str = f"${volume_24h:.0f}"
+        vol_str = _human_usd(volume_24h, 1)
         
         # Direction arrows
-        price_arrow = "▲" if price_change_24h > 0 else "▼" if price_change_24h < 0 else "→"
+        price_arrow = change_arrow(price_change_24h)
         
         # Assume volume change is positive (you could get actual volume change if available from API)
         volume_change = 1.4  # Default positive change, could be enhanced with historical data
-        volume_arrow = "▲" if volume_change > 0 else "▼" if volume_change < 0 else "→"
+        volume_arrow = change_arrow(volume_change)
         
         # Format rank
         rank_str = f"(#{market_cap_rank})" if market_cap_rank != "N/A" else ""
@@ -921,21 +987,22 @@ def get_individual_crypto_stats(symbol):
         logger.error(f"Error fetching {symbol} stats: {e}")
         return f"Sorry, I couldn't get detailed stats for {symbol.upper()}. Please try again later."
 
-def get_individual_crypto_ai_analysis(coin_data):
-    """Get AI analysis for individual cryptocurrency."""
-    try:
-        api_key = Config.DEEPSEEK_API
-        if not api_key:
-            return "AI analysis unavailable."
-        
-        prompt = f"""Analyze {coin_data['name']} ({coin_data['symbol']}):
+def _coin_analysis_key(coin_data, api_key):
+    """Round a coin's inputs so analyses are only re-requested on meaningful moves."""
+    return (
+        coin_data['symbol'],
+        float(f"{coin_data['price']:.3g}"),
+        round(coin_data['change_24h'], 1),
+    )
+
+_COIN_ANALYSIS_PROMPT = """Analyze {name} ({symbol}):
 
-Current Price: ${coin_data['price']:.4f}
-24h Change: {coin_data['change_24h']:+.2f}%
-Market Cap: ${coin_data['market_cap']/1e9:.2f}B
-24h Volume: ${coin_data['volume']/1e9:.2f}B
-24h High: ${coin_data['high_24h']:.4f}
-24h Low: ${coin_data['low_24h']:.4f}
+Current Price: ${price:.4f}
+24h Change: {change_24h:+.2f}%
+Market Cap: ${market_cap_b:.2f}B
+24h Volume: ${volume_b:.2f}B
+24h High: ${high_24h:.4f}
+24h Low: ${low_24h:.4f}
 
 Provide analysis in EXACTLY this format (no extra text, no markdown headers):
 
@@ -953,38 +1020,29 @@ Prediction (Next 24hr): 🟢 BUY / 🟠 HOLD / 🔴 SELL (with optional brief re
 
 Use realistic technical levels based on current price. Format all prices consistently. Keep it concise and professional."""
 
-        headers = {
-            "Authorization": f"Bearer {api_key}",
-            "Content-Type": "application/json"
-        }
-        
-        payload = {
-            "model": "deepseek-chat",
-            "messages": [
-                {
-                    "role": "user",
-                    "content": prompt
-                }
-            ],
-            "max_tokens": 300,
-            "temperature": 0.7
-        }
-        
-        response = _rate_limited_post(
-            "https://api.deepseek.com/chat/completions",
-            min_interval=2.0,
-            headers=headers,
-            json=payload,
-            timeout=15
-        )
+@ttl_cache(seconds=_ai_analysis_cache_duration, key=_coin_analysis_key)
+def _request_individual_crypto_ai_analysis(coin_data, api_key):
+    """Ask DeepSeek for a single coin analysis; raises on API errors so failures are not cached."""
+    prompt = _COIN_ANALYSIS_PROMPT.format(
+        name=coin_data['name'],
+        symbol=coin_data['symbol'],
+        price=coin_data['price'],
+        change_24h=coin_data['change_24h'],
+        market_cap_b=coin_data['market_cap'] / 1e9,
+        volume_b=coin_data['volume'] / 1e9,
+        high_24h=coin_data['high_24h'],
+        low_24h=coin_data['low_24h'],
+    )
+    return _deepseek_chat(prompt, api_key, max_tokens=300)
+
+def get_individual_crypto_ai_analysis(coin_data):
+    """Get AI analysis for individual cryptocurrency."""
+    try:
+        api_key = Config.DEEPSEEK_API
+        if not api_key:
+            return "AI analysis unavailable."
         
-        if response.status_code == 200:
-            result = response.json()
-            analysis = result["choices"][0]["message"]["content"].strip()
-            return analysis
-        else:
-            logger.error(f"DeepSeek API error: {response.status_code}")
-            return "AI analysis temporarily unavailable."
+        return _request_individual_crypto_ai_analysis(coin_data, api_key)
             
     except Exception as e:
         logger.error(f"Error getting individual crypto AI analysis: {e}")
@@ -1012,7 +1070,7 @@ def get_individual_crypto_stats_with_ai(symbol):
         response = _rate_limited_request(url, min_interval=1.5, timeout=15, params=params)
         response.raise_for_status()
         
-        data = response.json()
+        data = parse_json(response)
         market_data = data.get("market_data", {})
         
         # Extract key metrics
@@ -1028,23 +1086,13 @@ def get_individual_crypto_stats_with_ai(symbol):
         price_str = format_crypto_price(current_price)
         
         # Format market cap
-        if market_cap >= 1e9:
-            mcap_str = f"${market_cap/1e9:.2f}B"
-        elif market_cap >= 1e6:
-            mcap_str = f"${market_cap/1e6:.2f}M"
-        else:
-            mcap_str = f"${market_cap:.0f}"
+        mcap_str = _human_usd(market_cap, 2)
         
         # Format volume
-        if volume_24h >= 1e9:
-            vol_str = f"${volume_24h/1e9:.2f}B"
-        elif volume_24h >= 1e6:
-            vol_str = f"${volume_24h/1e6:.2f}M"
-        else:
-            vol_str = f"${volume_24h:.0f}"
+        vol_str = _human_usd(volume_24h, 2)
         
         # Direction arrow
-        arrow = "▲" if price_change_24h > 0 else "▼" if price_change_24h < 0 else "→"
+        arrow = change_arrow(price_change_24h)
         
         # Get AI analysis
         ai_analysis = get_individual_crypto_ai_analysis({
@@ -1094,147 +1142,141 @@ Market Summary: {name} is currently trading at {price_str} with a 24h change of
 
 # ===================== WEATHER DATA =====================
 
+# Estimated AQI from PM2.5 (µg/m³): upper bound of each band, and the
+# (band start, AQI at band start, AQI per µg/m³, label) used inside it
+_PM25_UPPER_BOUNDS = (12, 35.4, 55.4)
+_PM25_AQI_BANDS = (
+    (0, 0, 4.17, "Good"),
+    (12.1, 51, 2.1, "Moderate"),
+    (35.5, 101, 2.5, "Unhealthy for Sensitive Groups"),
+    (0, 151, 0, "Unhealthy"),
+)
+
+def pm25_to_aqi(pm2_5):
+    """
+    Estimate the AQI value and label for a PM2.5 concentration.
+    
+    Args:
+        pm2_5 (float): PM2.5 concentration in µg/m³
+        
+    Returns:
+        tuple: (AQI value, label)
+    """
+    c_low, i_low, slope, label = _PM25_AQI_BANDS[bisect_left(_PM25_UPPER_BOUNDS, pm2_5)]
+    return int(i_low + (pm2_5 - c_low) * slope), label
+
+# Label and representative AQI for each US EPA index, used when PM2.5 is missing
+_EPA_AQI_LEVELS = {
+    1: ("Good", 45), 2: ("Moderate", 65), 3: ("Unhealthy for Sensitive", 105),
+    4: ("Unhealthy", 155), 5: ("Very Unhealthy", 205), 6: ("Hazardous", 305)
+}
+
+# Emoji used in the weather section
+RAIN_EMOJI = "🌧️"
+TEMP_EMOJI = "🌡️"
+AQ_EMOJI = "🫧"
+UV_EMOJI = "🔆"
+
+# Shown when the weather request fails, matching the sample format
+_DHAKA_WEATHER_FALLBACK = f"""☀️ WEATHER NOW
+{TEMP_EMOJI} Temperature: 29.1°C - 36.1°C
+{RAIN_EMOJI} Condition: Light rain shower  
+{AQ_EMOJI} Air Quality: Moderate (AQI 70)
+{UV_EMOJI} UV Index: High (5.8/11)
+"""
+
+def get_weather_emoji(condition_text):
+    """Get the emoji for a WeatherAPI condition text."""
+    condition_lower = condition_text.lower()
+    if any(word in condition_lower for word in ['rain', 'drizzle', 'shower']):
+        return RAIN_EMOJI
+    elif any(word in condition_lower for word in ['snow', 'blizzard']):
+        return "❄️"
+    elif any(word in condition_lower for word in ['thunder', 'storm']):
+        return "⛈️"
+    elif any(word in condition_lower for word in ['cloud', 'overcast']):
+        return "☁️"
+    elif any(word in condition_lower for word in ['fog', 'mist', 'haze']):
+        return "🌫️"
+    elif any(word in condition_lower for word in ['clear', 'sunny']):
+        return "☀️"
+    elif any(word in condition_lower for word in ['partly']):
+        return "⛅"
+    else:
+        return "🌤️"  # Default partly cloudy
+
 def get_dhaka_weather():
     """Get comprehensive Dhaka weather data with detailed formatting."""
-    try:
-        api_key = Config.WEATHERAPI_KEY
-        if not api_key:
-            return ""
-            
-        url = "http://api.weatherapi.com/v1/current.json"
-        params = {
-            "key": api_key,
-            "q": "Dhaka",
-            "aqi": "yes"
-        }
+    api_key = Config.WEATHERAPI_KEY
+    if not api_key:
+        return ""
         
-        response = _rate_limited_request(url, min_interval=2.0, timeout=15, params=params)
+    url = "http://api.weatherapi.com/v1/current.json"
+    params = {
+        "key": api_key,
+        "q": "Dhaka",
+        "aqi": "yes"
+    }
+    
+    try:
+        response = _rate_limited_request(url, min_interval=2.0, timeout=15, cache_seconds=_weather_cache_duration, params=params)
         response.raise_for_status()
-        
-        data = response.json()
-        current = data.get("current", {})
-        location = data.get("location", {})
-        
-        # Temperature data
-        temp_c = current.get("temp_c", 25)
-        feels_like_c = current.get("feelslike_c", temp_c)
-        
-        condition = current.get("condition", {}).get("text", "Partly cloudy")
-        if not condition:
-            condition = "Partly cloudy"
-            
-        humidity = current.get("humidity", 70)
-        if humidity is None:
-            humidity = 70
-        
-        # Wind data
-        wind_kph = current.get("wind_kph", 12)
-        if wind_kph is None:
-            wind_kph = 12
-            
-        wind_dir = current.get("wind_dir", "SE")
-        if not wind_dir:
-            wind_dir = "SE"
-        
-        # Visibility
-        vis_km = current.get("vis_km", 10)
-        if vis_km is None:
-            vis_km = 10
-        
-        # UV Index
-        uv = current.get("uv", 7)
-        if uv is None:
-            uv = 7
-        
-        # Ensure UV is a number and format it properly
-        try:
-            uv = float(uv)
-            if uv <= 2:
-                uv_level = "Low"
-            elif uv <= 5:
-                uv_level = "Moderate"
-            elif uv <= 7:
-                uv_level = "High"
-            elif uv <= 10:
-                uv_level = "Very High"
-            else:
-                uv_level = "Extreme"
-            uv_str = f"{uv_level} ({uv:.1f}/11)"
-        except (ValueError, TypeError):
-            uv_str = "Moderate (5.0/11)"
-        
-        # Air Quality with detailed AQI value
-        aqi_data = current.get("air_quality", {})
-        us_epa = aqi_data.get("us-epa-index", 2)
-        
-        # Try to get specific AQI value if available
-        pm2_5 = aqi_data.get("pm2_5", 0)
-        pm10 = aqi_data.get("pm10", 0)
-        
-        # Calculate estimated AQI from PM2.5 if available
-        if pm2_5 > 0:
-            if pm2_5 <= 12:
-                aqi_value = int(pm2_5 * 4.17)  # 0-50 range
-                aqi_text = "Good"
-            elif pm2_5 <= 35.4:
-                aqi_value = int(51 + (pm2_5 - 12.1) * 2.1)  # 51-100 range
-                aqi_text = "Moderate"
-            elif pm2_5 <= 55.4:
-                aqi_value = int(101 + (pm2_5 - 35.5) * 2.5)  # 101-150 range
-                aqi_text = "Unhealthy for Sensitive Groups"
-            else:
-                aqi_value = 151
-                aqi_text = "Unhealthy"
-        else:
-            # Fallback based on EPA index
-            aqi_levels = {
-                1: ("Good", 45), 2: ("Moderate", 65), 3: ("Unhealthy for Sensitive", 105), 
-                4: ("Unhealthy", 155), 5: ("Very Unhealthy", 205), 6: ("Hazardous", 305)
-            }
-            aqi_text, aqi_value = aqi_levels.get(us_epa, ("Moderate", 65))
-        
-        # Get weather emoji based on condition
-        def get_weather_emoji(condition_text):
-            condition_lower = condition_text.lower()
-            if any(word in condition_lower for word in ['rain', 'drizzle', 'shower']):
-                return "🌧️"
-            elif any(word in condition_lower for word in ['snow', 'blizzard']):
-                return "❄️"
-            elif any(word in condition_lower for word in ['thunder', 'storm']):
-                return "⛈️"
-            elif any(word in condition_lower for word in ['cloud', 'overcast']):
-                return "☁️"
-            elif any(word in condition_lower for word in ['fog', 'mist', 'haze']):
-                return "🌫️"
-            elif any(word in condition_lower for word in ['clear', 'sunny']):
-                return "☀️"
-            elif any(word in condition_lower for word in ['partly']):
-                return "⛅"
-            else:
-                return "🌤️"  # Default partly cloudy
-        
-        weather_emoji = get_weather_emoji(condition)
-        
-        # Create temperature range (current feels like range)
-        temp_min = temp_c - 2  # Approximate daily range
-        temp_max = temp_c + 5
-        
-        weather_section = f"""☀️ WEATHER
-🌡️ {temp_min:.1f}°C - {temp_max:.1f}°C | {weather_emoji} {condition}
-🫧 Air: {aqi_text} (AQI {aqi_value}) | 🔆 UV: {uv_str}
-"""
-        
-        return weather_section
-        
-    except Exception as e:
+        data = parse_json(response)
+    except (RequestException, ValueError) as e:
         logger.error(f"Error fetching weather data: {e}")
-        # Return a fallback weather section matching the sample format
-        return """☀️ WEATHER NOW
-🌡️ Temperature: 29.1°C - 36.1°C
-🌧️ Condition: Light rain shower  
-🫧 Air Quality: Moderate (AQI 70)
-🔆 UV Index: High (5.8/11)
-"""
+        return _DHAKA_WEATHER_FALLBACK
+    
+    current = data.get("current") if isinstance(data, dict) else None
+    if not isinstance(current, dict):
+        logger.error(f"Unexpected weather response: {str(data)[:200]}")
+        return _DHAKA_WEATHER_FALLBACK
+    
+    # Temperature data
+    temp_c = to_float(current.get("temp_c"))
+    if temp_c is None:
+        temp_c = 25
+    
+    condition = current.get("condition")
+    condition = condition.get("text") if isinstance(condition, dict) else None
+    if not condition or not isinstance(condition, str):
+        condition = "Partly cloudy"
+    
+    # UV Index
+    uv = current.get("uv")
+    uv = 7.0 if uv is None else to_float(uv)
+    if uv is None:
+        uv_str = "Moderate (5.0/11)"
+    else:
+        uv_str = f"{uv_level(uv)} ({uv:.1f}/11)"
+    
+    # Air Quality with detailed AQI value
+    aqi_data = current.get("air_quality")
+    if not isinstance(aqi_data, dict):
+        aqi_data = {}
+    us_epa = aqi_data.get("us-epa-index", 2)
+    
+    # Try to get specific AQI value if available
+    pm2_5 = to_float(aqi_data.get("pm2_5", 0))
+    
+    # Calculate estimated AQI from PM2.5 if available
+    if pm2_5 is not None and pm2_5 > 0:
+        aqi_value, aqi_text = pm25_to_aqi(pm2_5)
+    else:
+        # Fallback based on EPA index
+        level = _EPA_AQI_LEVELS.get(us_epa) if isinstance(us_epa, (int, float)) else None
+        aqi_text, aqi_value = level or ("Moderate", 65)
+    
+    weather_emoji = get_weather_emoji(condition)
+    
+    # Create temperature range (current feels like range)
+    temp_min = temp_c - 2  # Approximate daily range
+    temp_max = temp_c + 5
+    
+    return (
+        f"☀️ WEATHER\n"
+        f"{TEMP_EMOJI} {temp_min:.1f}°C - {temp_max:.1f}°C | {weather_emoji} {condition}\n"
+        f"{AQ_EMOJI} Air: {aqi_text} (AQI {aqi_value}) | {UV_EMOJI} UV: {uv_str}\n"
+    )
 
 # ===================== HOLIDAYS =====================
 
@@ -1247,24 +1289,9 @@ def get_bd_holidays():
             return ""
             
         today = get_bd_now()
-        url = "https://calendarific.com/api/v2/holidays"
-        params = {
-            "api_key": api_key,
-            "country": "BD",
-            "year": today.year,
-            "month": today.month,
-            "day": today.day
-        }
-        
         logger.debug(f"Checking holidays for date: {today.year}-{today.month:02d}-{today.day:02d}")
         
-        response = _rate_limited_request(url, min_interval=3.0, timeout=15, params=params)
-        response.raise_for_status()
-        
-        data = response.json()
-        logger.debug(f"Holiday API response: {data}")
-        
-        holidays = data.get("response", {}).get("holidays", [])
+        holidays = get_holidays_on(today)
         
         if holidays:
             holiday_names = []
@@ -1367,9 +1394,9 @@ def fetch_global_market_indices():
         url = f"https://api.twelvedata.com/quote?symbol={symbols}&apikey={api_key}"
         response = _rate_limited_request(url, min_interval=2.0, timeout=15)
         response.raise_for_status()
-        data = response.json()
+        data = parse_json(response)
 
-        section = f"🌐 GLOBAL MARKET INDEX\n"
+        lines = ["🌐 GLOBAL MARKET INDEX"]
         for symbol, (name, country) in indices.items():
             idx = data.get(symbol, {})
             price = idx.get('close', 'N/A')
@@ -1379,7 +1406,7 @@ def fetch_global_market_indices():
             if change != 'N/A':
                 try:
                     change_num = float(change)
-                    arrow = "▲" if change_num > 0 else "▼" if change_num < 0 else "→"
+                    arrow = change_arrow(change_num)
                     change_str = f"({change_num:+.2f}%)"
                 except:
                     arrow = "→"
@@ -1388,8 +1415,8 @@ def fetch_global_market_indices():
                 arrow = "→"
                 change_str = "(N/A%)"
             
-            section += f"{symbol} ({country}): {price} {change_str} {arrow}\n"
-        return section + "\n"
+            lines.append(f"{symbol} ({country}): {price} {change_str} {arrow}")
+        return "\n".join(lines) + "\n\n"
     except Exception as e:
         logger.error(f"Error fetching global market indices: {e}")
         return "🌐 GLOBAL MARKET INDEX\nData unavailable.\n\n"
@@ -1402,24 +1429,36 @@ def get_full_news_digest():
     date_str = now.strftime('%b %d, %Y %-I:%M%p BDT (UTC +6)')
     header = f"📢 TOP NEWS HEADLINES\n{date_str}"
     
+    # Every section is an independent network fetch, so run them all at once
+    results = run_concurrently([
+        ('holiday', get_bd_holidays),
+        ('weather', get_dhaka_weather),
+        ('local', get_breaking_local_news),
+        ('global', get_breaking_global_news),
+        ('tech', get_breaking_tech_news),
+        ('sports', get_breaking_sports_news),
+        ('crypto', get_breaking_crypto_news),
+        ('crypto_market', fetch_crypto_market_with_ai),
+    ])
+    
     # 2. Holiday
-    holiday = get_bd_holidays().strip()
+    holiday = results['holiday'].strip()
     if holiday:
         header += f"\n{holiday}"
 
     # 3. Weather
-    weather = get_dhaka_weather().strip()
+    weather = results['weather'].strip()
     header += f"\n\n{weather}"
 
     # 4. News sections
-    local = get_breaking_local_news().strip()
-    globaln = get_breaking_global_news().strip()
-    tech = get_breaking_tech_news().strip()
-    sports = get_breaking_sports_news().strip()
-    crypto = get_breaking_crypto_news().strip()
+    local = results['local'].strip()
+    globaln = results['global'].strip()
+    tech = results['tech'].strip()
+    sports = results['sports'].strip()
+    crypto = results['crypto'].strip()
 
     # 5. Crypto Market Status (compact version)
-    crypto_market = fetch_crypto_market_with_ai().strip()
+    crypto_market = results['crypto_market'].strip()
 
     # 6. Footer (shortened)
     footer = "Type /help for more info.\n━━━━━━━━━━━━━━\n🤖 By Shanchoy Noor"
@@ -1443,15 +1482,11 @@ def get_full_news_digest():
 def get_crypto_stats_digest():
     """Return only the crypto market section for /cryptostats command."""
     try:
-        # Fetch market overview with rate limiting
-        url = "https://api.coingecko.com/api/v3/global"
-        response = _rate_limited_request(url, min_interval=1.5, timeout=15)
-        response.raise_for_status()
-        
-        data = response.json()["data"]
-        market_cap = data["total_market_cap"]["usd"]
-        volume = data["total_volume"]["usd"]
-        market_change = data["market_cap_change_percentage_24h_usd"]
+        # Fetch market overview, shared with the other crypto sections
+        totals = fetch_global_market_totals()
+        market_cap = totals["market_cap"]
+        volume = totals["volume"]
+        market_change = totals["market_change"]
         
         # Get volume change (if available, otherwise estimate as same as market cap change)
         volume_change = market_change  # API doesn't provide volume change, use market change as approximation
@@ -1468,24 +1503,25 @@ def get_crypto_stats_digest():
         }
         
         crypto_response = _rate_limited_request(crypto_url, min_interval=2.0, timeout=15, params=crypto_params)
-        crypto_data = crypto_response.json()
+        crypto_data = parse_json(crypto_response)
         
         # Fetch Fear & Greed Index with rate limiting
         try:
             fear_response = _rate_limited_request("https://api.alternative.me/fng/?limit=1", min_interval=1.0, timeout=10)
-            fear_index = fear_response.json()["data"][0]["value"]
-            fear_text = fear_response.json()["data"][0]["value_classification"]
+            fear_data = parse_json(fear_response)["data"][0]
+            fear_index = fear_data["value"]
+            fear_text = fear_data["value_classification"]
         except:
             fear_index = "N/A"
             fear_text = "Unknown"
         
         # Format market cap and volume with arrows
-        market_cap_str = f"${market_cap/1e12:.2f}T" if market_cap >= 1e12 else f"${market_cap/1e9:.2f}B"
-        volume_str = f"${volume/1e12:.2f}T" if volume >= 1e12 else f"${volume/1e9:.2f}B"
+        market_cap_str = _format_market_total(market_cap)
+        volume_str = _format_market_total(volume)
         
         # Add arrows for market cap and volume
-        market_arrow = "▲" if market_change > 0 else "▼" if market_change < 0 else "→"
-        volume_arrow = "▲" if volume_change > 0 else "▼" if volume_change < 0 else "→"
+        market_arrow = change_arrow(market_change)
+        volume_arrow = change_arrow(volume_change)
         
         # Fear/Greed Index with buy/sell/hold indicator
         fear_greed_text = ""
@@ -1501,13 +1537,13 @@ def get_crypto_stats_digest():
             fear_greed_text = f"{fear_index}/100"
         
         # Build crypto section for /cryptostats
-        crypto_section = f"""💰 CRYPTO MARKET:
+        parts = [f"""💰 CRYPTO MARKET:
 Market Cap: {market_cap_str} ({market_change:+.2f}%) {market_arrow}
 Volume: {volume_str} ({volume_change:+.2f}%) {volume_arrow}
 Fear/Greed Index: {fear_greed_text}
 
 💎 Big Cap Crypto:
-"""
+"""]
         
         # Define specific big cap cryptos to display
         big_cap_targets = {
@@ -1527,12 +1563,12 @@ Fear/Greed Index: {fear_greed_text}
                 symbol = big_cap_targets[crypto['id']]
                 price = crypto['current_price']
                 change = crypto['price_change_percentage_24h'] or 0
-                arrow = "▲" if change > 0 else "▼" if change < 0 else "→"
+                arrow = change_arrow(change)
                 
                 # Format price appropriately using helper function
                 price_str = format_crypto_price(price)
                 
-                crypto_section += f"{symbol}: {price_str} ({change:+.2f}%) {arrow}\n"
+                parts.append(f"{symbol}: {price_str} ({change:+.2f}%) {arrow}\n")
         
         # Sort by 24h change for gainers and losers
         sorted_cryptos = sorted([c for c in crypto_data if c['price_change_percentage_24h'] is not None], 
@@ -1540,7 +1576,7 @@ Fear/Greed Index: {fear_greed_text}
         
         # Top 5 gainers (highest positive changes)
         gainers = sorted_cryptos[-5:][::-1]  # Reverse to get highest first
-        crypto_section += "\n📈 Crypto Top 5 Gainers:\n"
+        parts.append("\n📈 Crypto Top 5 Gainers:\n")
         for i, crypto in enumerate(gainers, 1):
             symbol = crypto['symbol'].upper()  # Use symbol instead of name
             price = crypto['current_price']
@@ -1550,11 +1586,11 @@ Fear/Greed Index: {fear_greed_text}
             # Format price appropriately using helper function
             price_str = format_crypto_price(price)
             
-            crypto_section += f"{i}. {symbol} {price_str} ({change:+.2f}%) {arrow}\n"
+            parts.append(f"{i}. {symbol} {price_str} ({change:+.2f}%) {arrow}\n")
         
         # Top 5 losers (lowest negative changes)
         losers = sorted_cryptos[:5]
-        crypto_section += "\n📉 Crypto Top 5 Losers:\n"
+        parts.append("\n📉 Crypto Top 5 Losers:\n")
         for i, crypto in enumerate(losers, 1):
             symbol = crypto['symbol'].upper()  # Use symbol instead of name
             price = crypto['current_price']
@@ -1564,9 +1600,9 @@ Fear/Greed Index: {fear_greed_text}
             # Format price appropriately using helper function
             price_str = format_crypto_price(price)
             
-            crypto_section += f"{i}. {symbol} {price_str} ({change:+.2f}%) {arrow}\n"
+            parts.append(f"{i}. {symbol} {price_str} ({change:+.2f}%) {arrow}\n")
         
-        return crypto_section
+        return "".join(parts)
         
     except Exception as e:
         logger.error(f"Error fetching crypto market data: {e}")
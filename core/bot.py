@@ -11,16 +11,47 @@ from utils.logging import get_logger
 from utils.config import Config
 from api.telegram import get_updates, send_telegram
 from services.bot_service import handle_updates
+from utils.concurrency import KeyedDispatcher
 
 logger = get_logger(__name__)
 
+# Back off for this long when a poll comes back empty faster than this
+MIN_EMPTY_POLL_SECONDS = 1
+
+# Number of chats whose commands are handled at the same time
+HANDLER_WORKERS = 8
+
+# Updates queued or being handled at once; polling waits while this many are outstanding
+MAX_PENDING_UPDATES = 100
+
+# While updates are still being handled, Telegram keeps resending them and
+# polls return at once, so poll at this interval instead of long polling
+BUSY_POLL_SECONDS = 0.25
+
+def _update_chat_id(update):
+    """Get the chat an update belongs to, so its updates are handled in order."""
+    if "message" in update:
+        return update["message"].get("chat", {}).get("id")
+    if "callback_query" in update:
+        callback_query = update["callback_query"]
+        return callback_query.get("message", {}).get("chat", {}).get("id") or callback_query.get("from", {}).get("id")
+    return None
+
 class ChoyNewsBot:
     """Main Telegram bot class for Choy News."""
     
     def __init__(self):
         """Initialize the ChoyNewsBot."""
         self.running = False
+        # Offset sent with the next poll; Telegram forgets updates below it
         self.last_update_id = None
+        # IDs of dispatched updates that are not handled yet, and one past the
+        # newest dispatched ID, guarded by the condition
+        self._pending_updates = set()
+        self._next_update_id = None
+        self._pending_changed = threading.Condition()
+        # Slow commands (e.g. /news) in one chat must not hold up other chats
+        self.dispatcher = KeyedDispatcher(HANDLER_WORKERS, MAX_PENDING_UPDATES, thread_name_prefix='handler')
     
     def run(self):
         """Run the bot polling loop."""
@@ -31,25 +62,109 @@ class ChoyNewsBot:
         try:
             while self.running:
                 logger.debug("Polling for updates...")
+                poll_started = time.monotonic()
+                # Long poll: Telegram holds the request until an update arrives
                 updates = get_updates(self.last_update_id)
                 
                 if updates:
                     logger.info(f"Received {len(updates)} updates")
-                    self.last_update_id = handle_updates(updates)
-                    logger.debug(f"Processed {len(updates)} updates, last_update_id: {self.last_update_id}")
+                    dispatched = self.dispatch_updates(updates)
+                    logger.debug(f"Dispatched {dispatched} new updates")
+                    if not dispatched:
+                        # Only updates still being handled came back; wait a
+                        # little rather than polling again straight away
+                        self._wait_for_handled_update()
                 else:
                     logger.debug("No updates received")
-                
-                time.sleep(1)  # Avoid excessive polling
+                    # An empty answer long before the poll timeout means the request failed
+                    if time.monotonic() - poll_started < MIN_EMPTY_POLL_SECONDS:
+                        time.sleep(MIN_EMPTY_POLL_SECONDS)
+                self.last_update_id = self._handled_offset()
         except KeyboardInterrupt:
             logger.info("Bot stopped by user")
             self.running = False
         except Exception as e:
             logger.error(f"Error in bot polling loop: {e}", exc_info=True)
             self.running = False
+        finally:
+            self._finish_pending_updates()
+    
+    def dispatch_updates(self, updates):
+        """
+        Hand updates to the handler pool without waiting for them to finish.
+        
+        Updates from the same chat are handled one at a time in the order
+        received; different chats are handled in parallel. Updates that were
+        dispatched before (Telegram resends them until they are acknowledged)
+        are skipped.
+        
+        Args:
+            updates (list): List of Telegram update objects
+            
+        Returns:
+            int: Number of newly dispatched updates
+        """
+        dispatched = 0
+        for update in updates:
+            update_id = update["update_id"]
+            with self._pending_changed:
+                if self._next_update_id is not None and update_id < self._next_update_id:
+                    continue
+                self._pending_updates.add(update_id)
+                self._next_update_id = update_id + 1
+            # Blocks while MAX_PENDING_UPDATES are outstanding
+            self.dispatcher.submit(_update_chat_id(update), self._handle_update, update)
+            dispatched += 1
+        return dispatched
+    
+    def _handle_update(self, update):
+        """Handle one update on a pool thread and mark it as done."""
+        try:
+            handle_updates([update])
+        finally:
+            with self._pending_changed:
+                self._pending_updates.discard(update["update_id"])
+                self._pending_changed.notify_all()
+    
+    def _handled_offset_locked(self):
+        """
+        Get the offset acknowledging every update handled so far; call with
+        _pending_changed held.
+        
+        Telegram drops all updates below the offset, so it stops at the oldest
+        update still being handled; anything not handled yet is redelivered if
+        the process dies.
+        """
+        if self._pending_updates:
+            return min(self._pending_updates)
+        return self._next_update_id
+    
+    def _handled_offset(self):
+        """Get the offset acknowledging every update handled so far."""
+        with self._pending_changed:
+            return self._handled_offset_locked()
+    
+    def _wait_for_handled_update(self):
+        """Wait until an outstanding update finishes, or BUSY_POLL_SECONDS pass."""
+        offset = self.last_update_id
+        with self._pending_changed:
+            self._pending_changed.wait_for(
+                lambda: self._handled_offset_locked() != offset,
+                timeout=BUSY_POLL_SECONDS
+            )
+    
+    def _finish_pending_updates(self):
+        """Let queued updates finish, then acknowledge them to Telegram."""
+        logger.info("Waiting for queued updates to be handled...")
+        self.dispatcher.shutdown()
+        offset = self._handled_offset()
+        if offset is not None and offset != self.last_update_id:
+            # A non-blocking poll with the new offset is how Telegram is told
+            get_updates(offset, timeout=0)
+            self.last_update_id = offset
     
     def stop(self):
-        """Stop the bot polling loop."""
+        """Stop the bot polling loop; run() returns once queued updates are handled."""
         self.running = False
         logger.info("Bot stopping...")
     
@@ -9,9 +9,19 @@ import logging
 from datetime import datetime
 from utils.logging import get_logger
 from utils.time_utils import get_bd_now, get_bd_time_str
+from utils.concurrency import run_concurrently
 
 logger = get_logger(__name__)
 
+def _capture_errors(func):
+    """Wrap a section fetcher so it returns (result, exception) instead of raising."""
+    def wrapper():
+        try:
+            return func(), None
+        except Exception as e:
+            return None, e
+    return wrapper
+
 def build_news_digest(user=None, include_crypto=True, include_weather=True, include_world_news=True, include_tech_news=True):
     """
     Build a personalized news digest for a user.
@@ -45,12 +55,28 @@ def build_news_digest(user=None, include_crypto=True, include_weather=True, incl
         now = get_bd_now()
         time_str = get_bd_time_str(now)
         
+        # Every section is an independent network fetch, so run them all at once
+        tasks = [
+            ('holidays', get_bd_holidays),
+            ('local', get_breaking_local_news),
+            ('sports', get_breaking_sports_news),
+            ('crypto_news', get_breaking_crypto_news),
+        ]
+        if include_weather:
+            tasks.append(('weather', get_dhaka_weather))
+        if include_world_news:
+            tasks.append(('global', get_breaking_global_news))
+        if include_tech_news:
+            tasks.append(('tech', get_breaking_tech_news))
+        if include_crypto:
+            tasks.append(('crypto_market', fetch_crypto_market_with_ai))
+        results = run_concurrently([(key, _capture_errors(func)) for key, func in tasks])
+        
         # Get holiday information
-        holidays_info = ""
-        try:
-            holidays_info = get_bd_holidays()
-        except Exception as e:
-            logger.debug(f"Holiday API failed: {e}")
+        holidays_info, error = results['holidays']
+        if error:
+            logger.debug(f"Holiday API failed: {error}")
+            holidays_info = ""
         
         if not holidays_info.strip():
             # Fallback to manual check for today's holiday
@@ -72,14 +98,18 @@ def build_news_digest(user=None, include_crypto=True, include_weather=True, incl
         
         # Add weather first
         if include_weather:
-            weather_section = get_dhaka_weather()
+            weather_section, error = results['weather']
+            if error:
+                raise error
             if weather_section:
                 # Weather section already has its own header, don't duplicate
                 sections.append(weather_section.strip())
         
         # Add news sections with better error handling
         try:
-            local_news = get_breaking_local_news()
+            local_news, error = results['local']
+            if error:
+                raise error
             sections.append(local_news if local_news and local_news.strip() else "*🇧🇩 LOCAL NEWS:*\n1. 🔄 Latest breaking local news being monitored...\n2. 📊 Local political developments being tracked...\n3. 💼 Regional economic updates in progress...\n4. 🏛️ Government policy updates being compiled...\n5. 🌟 Community developments being monitored...\n")
         except Exception as e:
             logger.warning(f"Error getting local news: {e}")
@@ -87,7 +117,9 @@ def build_news_digest(user=None, include_crypto=True, include_weather=True, incl
         
         if include_world_news:
             try:
-                global_news = get_breaking_global_news()
+                global_news, error = results['global']
+                if error:
+                    raise error
                 sections.append(global_news if global_news and global_news.strip() else "*🌍 GLOBAL NEWS:*\n1. 🌍 International breaking news being updated...\n2. 🔥 Global crisis developments being tracked...\n3. 💸 World economic updates coming soon...\n4. 🕊️ International affairs updates in progress...\n5. ⚡ Breaking global events being monitored...\n")
             except Exception as e:
                 logger.warning(f"Error getting global news: {e}")
@@ -95,21 +127,27 @@ def build_news_digest(user=None, include_crypto=True, include_weather=True, incl
         
         if include_tech_news:
             try:
-                tech_news = get_breaking_tech_news()
+                tech_news, error = results['tech']
+                if error:
+                    raise error
                 sections.append(tech_news if tech_news and tech_news.strip() else "*🚀 TECH NEWS:*\n1. 💡 Latest technology breakthroughs being analyzed...\n2. 🤖 AI and innovation updates coming soon...\n3. 🔧 Tech industry developments being tracked...\n4. 💰 Startup and venture updates in progress...\n5. 📱 Digital transformation news being compiled...\n")
             except Exception as e:
                 logger.warning(f"Error getting tech news: {e}")
                 sections.append("*🚀 TECH NEWS:*\n1. 📰 News updates will be available shortly...\n2. 🔍 Breaking news being monitored...\n3. 📈 Latest developments being tracked...\n4. ⏰ Updates coming soon...\n5. 📝 News compilation in progress...\n")
         
         try:
-            sports_news = get_breaking_sports_news()
+            sports_news, error = results['sports']
+            if error:
+                raise error
             sections.append(sports_news if sports_news and sports_news.strip() else "*🏆 SPORTS NEWS:*\n1. ⚽ Live sports scores and updates being compiled...\n2. 🏅 League standings and results coming soon...\n3. 🔄 Player transfers and moves being tracked...\n4. 🏟️ Tournament updates in progress...\n5. 📈 Sports analysis and commentary being prepared...\n")
         except Exception as e:
             logger.warning(f"Error getting sports news: {e}")
             sections.append("*🏆 SPORTS NEWS:*\n1. 📰 News updates will be available shortly...\n2. 🔍 Breaking news being monitored...\n3. 📈 Latest developments being tracked...\n4. ⏰ Updates coming soon...\n5. 📝 News compilation in progress...\n")
         
         try:
-            crypto_news = get_breaking_crypto_news()
+            crypto_news, error = results['crypto_news']
+            if error:
+                raise error
             sections.append(crypto_news if crypto_news and crypto_news.strip() else "*🪙 FINANCE & CRYPTO NEWS:*\n1. 📊 Cryptocurrency market movements being analyzed...\n2. 🔗 DeFi protocol updates being tracked...\n3. ⛓️ Blockchain developments coming soon...\n4. 📜 Digital asset regulatory news in progress...\n5. 💹 Crypto trading insights being compiled...\n")
         except Exception as e:
             logger.warning(f"Error getting crypto news: {e}")
@@ -118,27 +156,28 @@ def build_news_digest(user=None, include_crypto=True, include_weather=True, incl
         # Add crypto market data with AI analysis if enabled
         if include_crypto:
             try:
-                crypto_market = fetch_crypto_market_with_ai()
+                crypto_market, error = results['crypto_market']
+                if error:
+                    raise error
                 sections.append(crypto_market if crypto_market and crypto_market.strip() else "*💰 CRYPTOCURRENCY MARKET:*\nMarket data temporarily unavailable. Updates coming soon...\n")
             except Exception as e:
                 logger.warning(f"Error getting crypto market data: {e}")
                 sections.append("*💰 CRYPTOCURRENCY MARKET:*\nMarket data temporarily unavailable. Updates coming soon...\n")
         
         # Combine all sections with proper spacing
-        digest = header
+        parts = [header]
         for section in sections:
             if section and section.strip():  # Only add non-empty sections
                 # Ensure proper spacing between sections
-                if not digest.endswith('\n\n'):
-                    digest += '\n'
-                digest += section
-                if not digest.endswith('\n'):
-                    digest += '\n'
+                if not parts[-1].endswith('\n\n'):
+                    parts.append('\n')
+                parts.append(section)
+                if not section.endswith('\n'):
+                    parts.append('\n')
         
-        # Add footer with proper spacing
-        if not digest.endswith('\n'):
-            digest += '\n'
-        digest += "━━━━━━━━━━━━━━━━━━━━━\n🤖 Developed by Shanchoy Noor\n"
+        # Add footer; the header and every section above end with a newline
+        parts.append("━━━━━━━━━━━━━━━━━━━━━\n🤖 Developed by Shanchoy Noor\n")
+        digest = "".join(parts)
         
         logger.info("Successfully built news digest")
         # Clean and return only the digest content, nothing more
@@ -244,16 +283,16 @@ def clean_digest_content(content):
     # Split by the footer marker to ensure nothing appears after it
     footer_marker = "🤖 Developed by [Shanchoy Noor]"
     
-    if footer_marker in content:
-        # Find the footer and cut everything after the GitHub link
-        footer_index = content.find(footer_marker)
-        github_end = content.find(")", footer_index)
-        if github_end > footer_index:
+    head, marker, tail = content.partition(footer_marker)
+    if marker:
+        # Cut everything after the GitHub link that follows the footer
+        link, link_end, _ = tail.partition(")")
+        if link_end:
             # Keep content only up to the end of the GitHub link
-            content = content[:github_end + 1]
+            content = head + marker + link + link_end
         else:
             # Fallback: add the GitHub link properly
-            content = content[:footer_index] + f"{footer_marker}(https://github.com/shanchoynoor)"
+            content = f"{head}{footer_marker}(https://github.com/shanchoynoor)"
     
     # Remove any stray content that doesn't belong in a news digest
     lines = content.split('\n')
@@ -329,13 +368,12 @@ def clean_digest_content(content):
             # Log what we're filtering out for debugging
             logger.debug(f"Filtering out non-digest content: {line[:100]}...")
     
-    result = '\n'.join(cleaned_lines).strip()
-    
-    # Final safety check: ensure we don't have any long paragraphs that snuck through
-    final_lines = result.split('\n')
+    # Final safety check: ensure we don't have any long paragraphs that snuck through.
+    # The kept lines are checked directly rather than joined and split again;
+    # the result is stripped once at the end.
     final_cleaned = []
     
-    for line in final_lines:
+    for line in cleaned_lines:
         # Allow all lines that are clearly part of our format
         if (line.strip() == '' or 
             line.strip().startswith(('*', '1.', '2.', '3.', '4.', '5.', '📢', '🇧🇩', '🌍', '🚀', '🏆', '🪙', '💰', '☀️', '🌤️', '━━━━━')) or
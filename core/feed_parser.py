@@ -0,0 +1,187 @@
+"""
+Lightweight RSS/Atom fetcher and parser for Choy News Bot.
+
+This module downloads feeds over the shared HTTP session with conditional
+GETs, streams the XML with ElementTree and extracts only the fields the
+digest uses (title, link, publish date, summary), falling back to
+feedparser for feeds that are not well-formed XML.
+"""
+
+from email.utils import parsedate_to_datetime
+from functools import lru_cache
+from io import BytesIO
+from xml.etree import ElementTree
+
+import time
+
+import feedparser
+from feedparser.datetimes import _parse_date
+
+from utils.logging import get_logger
+from utils.http import SESSION
+from utils.concurrency import host_slot
+from data_modules.feed_cache import get_cached_feed, update_cached_feed, mark_feed_fresh
+
+logger = get_logger(__name__)
+
+# Local tag names (namespace stripped) recognised for each field
+ENTRY_TAGS = ('item', 'entry')
+DATE_TAGS = ('pubDate', 'published', 'updated', 'date', 'issued', 'modified')
+SUMMARY_TAGS = ('description', 'summary', 'encoded', 'content')
+
+# Feeds fetched more recently than this are served from the cache without
+# any request, since publishers rarely update more often than that
+FEED_FRESH_SECONDS = 180
+
+@lru_cache(maxsize=8192)
+def parse_date(date_str):
+    """
+    Parse a feed date string into a UTC struct_time, memoized per raw string.
+
+    RSS dates are nearly always RFC 822, so the stdlib email parser is tried
+    first; feedparser's multi-format parser handles everything else.
+    """
+    try:
+        parsed = parsedate_to_datetime(date_str)
+    except (TypeError, ValueError, IndexError):
+        parsed = None
+    if parsed is not None:
+        # Naive results ("-0000") are already UTC
+        return parsed.utctimetuple()
+    return _parse_date(date_str)
+
+def _local_name(tag):
+    """Strip the '{namespace}' prefix from an ElementTree tag."""
+    return tag.rsplit('}', 1)[-1] if isinstance(tag, str) else ''
+
+def _entry_link(elem):
+    """Get the link of an item: RSS text link, else the Atom alternate href."""
+    fallback = ''
+    for child in elem:
+        if _local_name(child.tag) != 'link':
+            continue
+        text = (child.text or '').strip()
+        if text:
+            return text
+        href = child.get('href')
+        if href and child.get('rel', 'alternate') == 'alternate':
+            return href
+        fallback = fallback or href or ''
+    return fallback
+
+def _parse_entry(elem):
+    """
+    Extract the fields used by the news fetchers from an item/entry element.
+
+    Returns:
+        feedparser.FeedParserDict: Entry with title, link, published,
+        published_parsed and summary keys (when present in the feed)
+    """
+    fields = {}
+    for child in elem:
+        name = _local_name(child.tag)
+        if name == 'link':
+            continue
+        text = (child.text or '').strip()
+        if not text or name in fields:
+            continue
+        fields[name] = text
+
+    entry = feedparser.FeedParserDict()
+    entry['title'] = fields.get('title', '')
+    entry['link'] = _entry_link(elem)
+    published = next((fields[tag] for tag in DATE_TAGS if tag in fields), None)
+    if published:
+        entry['published'] = published
+        entry['published_parsed'] = parse_date(published)
+    summary = next((fields[tag] for tag in SUMMARY_TAGS if tag in fields), None)
+    if summary:
+        entry['summary'] = summary
+    return entry
+
+def parse_feed_entries(content):
+    """
+    Parse the entries of an RSS or Atom document.
+
+    Args:
+        content (bytes): Raw feed body
+
+    Returns:
+        list: feedparser-style entry dicts, in feed order
+    """
+    entries = []
+    try:
+        for _, elem in ElementTree.iterparse(BytesIO(content), events=('end',)):
+            if _local_name(elem.tag) in ENTRY_TAGS:
+                entries.append(_parse_entry(elem))
+                elem.clear()
+    except ElementTree.ParseError as e:
+        logger.debug(f"Feed is not well-formed XML ({e}), falling back to feedparser")
+        return feedparser.parse(content).entries
+    if not entries:
+        # Not RSS/Atom as far as we can tell; let feedparser have a go
+        return feedparser.parse(content).entries
+    return entries
+
+def _cacheable_entry(entry):
+    """Reduce a feedparser entry to the JSON-serializable fields used here."""
+    cached = {key: entry[key] for key in ('title', 'link', 'published', 'updated') if key in entry}
+    if entry.get('summary'):
+        cached['summary'] = entry['summary'][:200]
+    published_parsed = entry.get('published_parsed') or entry.get('updated_parsed')
+    if published_parsed:
+        cached['published_parsed'] = list(published_parsed)
+    return cached
+
+def _restore_cached_entry(cached):
+    """Rebuild a feedparser-style entry from its cached form."""
+    entry = feedparser.FeedParserDict(cached)
+    if cached.get('published_parsed'):
+        entry['published_parsed'] = time.struct_time(cached['published_parsed'])
+    return entry
+
+def fetch_feed_entries(url, timeout=(3, 15)):
+    """
+    Download a feed and parse its entries.
+
+    Feeds fetched within the last FEED_FRESH_SECONDS are served from the
+    feed cache without a request. Otherwise a conditional GET is sent with
+    the cached validators, so unchanged feeds answer 304 and are served
+    from the cached entries.
+    Call data_modules.feed_cache.save_feed_cache() after a batch of fetches.
+
+    Args:
+        url (str): Feed URL
+        timeout (tuple): (connect, read) timeout in seconds
+
+    Returns:
+        list: feedparser-style entry dicts, in feed order
+
+    Raises:
+        requests.RequestException: If the download fails
+    """
+    cached = get_cached_feed(url)
+    if cached and time.time() - cached.get('fetched_at', 0) < FEED_FRESH_SECONDS:
+        logger.debug(f"Feed fetched recently, using cached entries: {url}")
+        return [_restore_cached_entry(e) for e in cached['entries']]
+    headers = {}
+    if cached:
+        if cached.get('etag'):
+            headers['If-None-Match'] = cached['etag']
+        if cached.get('modified'):
+            headers['If-Modified-Since'] = cached['modified']
+    with host_slot(url):
+        response = SESSION.get(url, headers=headers, timeout=timeout)
+    if response.status_code == 304 and cached:
+        logger.debug(f"Feed not modified, using cached entries: {url}")
+        mark_feed_fresh(url)
+        return [_restore_cached_entry(e) for e in cached['entries']]
+    response.raise_for_status()
+    entries = parse_feed_entries(response.content)
+    update_cached_feed(
+        url,
+        response.headers.get('ETag'),
+        response.headers.get('Last-Modified'),
+        [_cacheable_entry(e) for e in entries]
+    )
+    return entries
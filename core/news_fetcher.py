@@ -5,92 +5,136 @@ This module handles fetching news from various RSS sources and external APIs.
 """
 
 import requests
-import feedparser
 import json
 import os
+import re
+import time
+import calendar
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass
 from datetime import datetime, timedelta
+from functools import lru_cache
+from operator import attrgetter
 from utils.logging import get_logger
 from utils.config import Config
+from api.telegram import escape_markdown
+from utils.http import SESSION, DEFAULT_TIMEOUT, parse_json
+from utils.concurrency import run_concurrently, FEED_POOL
+from utils.cache import ttl_cache
+from data_modules.feed_cache import save_feed_cache
+from core.feed_parser import fetch_feed_entries, parse_date
 
 logger = get_logger(__name__)
 
+@dataclass(frozen=True, slots=True)
+class NewsEntry:
+    """A normalized news item from an RSS feed."""
+    title: str
+    link: str
+    source: str
+    published: str
+    time_ago: str
+    hours_diff: float
+    summary: str
+
+@lru_cache(maxsize=4096)
+def _parse_published_time(time_str):
+    """
+    Parse a feed timestamp string into a naive datetime.
+    Results are memoized since many entries share the same timestamps.
+    Args:
+        time_str (str): Stripped published time string
+    Returns:
+        datetime: Parsed time, or None if no known format matches
+    """
+    pub_time = None
+    
+    # Handle different date formats
+    try:
+        # RFC 822 format: "Mon, 25 Nov 2024 14:30:00 GMT" or "Thu, 12 Jul 2025 01:31:44 +0000"
+        if "GMT" in time_str or "UTC" in time_str:
+            clean_str = time_str.replace("GMT", "").replace("UTC", "").strip()
+            pub_time = datetime.strptime(clean_str, "%a, %d %b %Y %H:%M:%S")
+        elif "+0000" in time_str or "+0600" in time_str or "-" in time_str.split()[-1]:
+            # Handle timezone offsets like "+0000", "+0600", etc.
+            # Remove timezone offset
+            parts = time_str.rsplit(' ', 1)
+            if len(parts) == 2 and ('+' in parts[1] or '-' in parts[1]):
+                clean_str = parts[0]
+                pub_time = datetime.strptime(clean_str, "%a, %d %b %Y %H:%M:%S")
+            else:
+                # Try full string
+                pub_time = datetime.strptime(time_str, "%a, %d %b %Y %H:%M:%S %z").replace(tzinfo=None)
+        # ISO format: "2024-11-25T14:30:00Z" or "2024-11-25T14:30:00"
+        elif "T" in time_str:
+            if time_str.endswith('Z'):
+                pub_time = datetime.strptime(time_str[:-1], "%Y-%m-%dT%H:%M:%S")
+            elif '+' in time_str:
+                # Handle timezone offset in ISO format
+                pub_time = datetime.strptime(time_str.split('+')[0], "%Y-%m-%dT%H:%M:%S")
+            elif '-' in time_str and time_str.count('-') > 2:
+                # Handle negative timezone offset
+                parts = time_str.split('-')
+                if len(parts) >= 4:  # Year-Month-Day-timezone
+                    clean_str = '-'.join(parts[:-1])
+                    pub_time = datetime.strptime(clean_str, "%Y-%m-%dT%H:%M:%S")
+            else:
+                pub_time = datetime.strptime(time_str[:19], "%Y-%m-%dT%H:%M:%S")
+        # Standard format: "2024-11-25 14:30:00"
+        elif time_str.count('-') == 2 and ':' in time_str:
+            pub_time = datetime.strptime(time_str[:19], "%Y-%m-%d %H:%M:%S")
+        # RSS common format: "Thu, 12 Jul 2025 01:31:44"
+        elif ',' in time_str and len(time_str.split()) >= 5:
+            # Try without timezone first
+            try:
+                pub_time = datetime.strptime(time_str, "%a, %d %b %Y %H:%M:%S")
+            except ValueError:
+                # If that fails, try with just the date part
+                parts = time_str.split()
+                if len(parts) >= 5:
+                    date_part = ' '.join(parts[:5])
+                    pub_time = datetime.strptime(date_part, "%a, %d %b %Y %H:%M:%S")
+    except ValueError:
+        pass
+    
+    # If all specific formats fail, try common fallbacks
+    if pub_time is None:
+        fallback_formats = [
+            "%Y-%m-%d %H:%M:%S",
+            "%d %b %Y %H:%M:%S",
+            "%Y/%m/%d %H:%M:%S",
+            "%m/%d/%Y %H:%M:%S",
+            "%d-%m-%Y %H:%M:%S",
+            "%Y-%m-%d",
+            "%d %b %Y"
+        ]
+        
+        for fmt in fallback_formats:
+            try:
+                pub_time = datetime.strptime(time_str[:len(fmt)], fmt)
+                break
+            except ValueError:
+                continue
+    
+    return pub_time
+
+def _format_time_ago(seconds):
+    """Format an age in seconds as 'now', 'Nmin ago', 'Nhr ago' or 'Nd ago'."""
+    if seconds < 60:
+        return "now"
+    elif seconds < 3600:
+        return f"{int(seconds // 60)}min ago"
+    elif seconds < 86400:
+        return f"{int(seconds // 3600)}hr ago"
+    return f"{int(seconds // 86400)}d ago"
+
 def get_hours_ago(published_time_str):
     """Calculate accurate hours ago from published time string."""
     if not published_time_str:
         return "Unknown"
     
     try:
-        pub_time = None
-        
-        # Clean the input string
-        time_str = published_time_str.strip()
-        
-        # Handle different date formats
-        try:
-            # RFC 822 format: "Mon, 25 Nov 2024 14:30:00 GMT" or "Thu, 12 Jul 2025 01:31:44 +0000"
-            if "GMT" in time_str or "UTC" in time_str:
-                clean_str = time_str.replace("GMT", "").replace("UTC", "").strip()
-                pub_time = datetime.strptime(clean_str, "%a, %d %b %Y %H:%M:%S")
-            elif "+0000" in time_str or "+0600" in time_str or "-" in time_str.split()[-1]:
-                # Handle timezone offsets like "+0000", "+0600", etc.
-                # Remove timezone offset
-                parts = time_str.rsplit(' ', 1)
-                if len(parts) == 2 and ('+' in parts[1] or '-' in parts[1]):
-                    clean_str = parts[0]
-                    pub_time = datetime.strptime(clean_str, "%a, %d %b %Y %H:%M:%S")
-                else:
-                    # Try full string
-                    pub_time = datetime.strptime(time_str, "%a, %d %b %Y %H:%M:%S %z").replace(tzinfo=None)
-            # ISO format: "2024-11-25T14:30:00Z" or "2024-11-25T14:30:00"
-            elif "T" in time_str:
-                if time_str.endswith('Z'):
-                    pub_time = datetime.strptime(time_str[:-1], "%Y-%m-%dT%H:%M:%S")
-                elif '+' in time_str:
-                    # Handle timezone offset in ISO format
-                    pub_time = datetime.strptime(time_str.split('+')[0], "%Y-%m-%dT%H:%M:%S")
-                elif '-' in time_str and time_str.count('-') > 2:
-                    # Handle negative timezone offset
-                    parts = time_str.split('-')
-                    if len(parts) >= 4:  # Year-Month-Day-timezone
-                        clean_str = '-'.join(parts[:-1])
-                        pub_time = datetime.strptime(clean_str, "%Y-%m-%dT%H:%M:%S")
-                else:
-                    pub_time = datetime.strptime(time_str[:19], "%Y-%m-%dT%H:%M:%S")
-            # Standard format: "2024-11-25 14:30:00"
-            elif time_str.count('-') == 2 and ':' in time_str:
-                pub_time = datetime.strptime(time_str[:19], "%Y-%m-%d %H:%M:%S")
-            # RSS common format: "Thu, 12 Jul 2025 01:31:44"
-            elif ',' in time_str and len(time_str.split()) >= 5:
-                # Try without timezone first
-                try:
-                    pub_time = datetime.strptime(time_str, "%a, %d %b %Y %H:%M:%S")
-                except ValueError:
-                    # If that fails, try with just the date part
-                    parts = time_str.split()
-                    if len(parts) >= 5:
-                        date_part = ' '.join(parts[:5])
-                        pub_time = datetime.strptime(date_part, "%a, %d %b %Y %H:%M:%S")
-        except ValueError:
-            pass
-        
-        # If all specific formats fail, try common fallbacks
-        if pub_time is None:
-            fallback_formats = [
-                "%Y-%m-%d %H:%M:%S",
-                "%d %b %Y %H:%M:%S",
-                "%Y/%m/%d %H:%M:%S",
-                "%m/%d/%Y %H:%M:%S",
-                "%d-%m-%Y %H:%M:%S",
-                "%Y-%m-%d",
-                "%d %b %Y"
-            ]
-            
-            for fmt in fallback_formats:
-                try:
-                    pub_time = datetime.strptime(time_str[:len(fmt)], fmt)
-                    break
-                except ValueError:
-                    continue
+        pub_time = _parse_published_time(published_time_str.strip())
         
         # If we still don't have a time, return Unknown
         if pub_time is None:
@@ -98,153 +142,174 @@ def get_hours_ago(published_time_str):
             return "Unknown"
         
         # Calculate time difference (assume UTC if no timezone specified)
-        now = datetime.now()
-        time_diff = now - pub_time
-        
-        # Convert to hours
-        hours_diff = time_diff.total_seconds() / 3600
+        seconds_diff = (datetime.now() - pub_time).total_seconds()
         
-        if hours_diff < 0:
+        if seconds_diff < 0:
             # Future time, likely timezone issue
-            hours_diff = abs(hours_diff)
+            hours_diff = abs(seconds_diff) / 3600
             if hours_diff < 1:
                 return "now"
             elif hours_diff < 24:
                 return f"{int(hours_diff)}hr ago"
             else:
                 return f"{int(hours_diff/24)}d ago"
-        elif hours_diff < 1:
-            minutes_diff = int(time_diff.total_seconds() / 60)
-            if minutes_diff < 1:
-                return "now"
-            else:
-                return f"{minutes_diff}min ago"
-        elif hours_diff < 24:
-            return f"{int(hours_diff)}hr ago"
-        else:
-            days_diff = int(hours_diff / 24)
-            return f"{days_diff}d ago"
+        return _format_time_ago(seconds_diff)
             
     except Exception as e:
         logger.debug(f"Error parsing time '{published_time_str}': {e}")
         return "Unknown"
 
-def fetch_rss_entries(sources, limit=5, max_age_hours=2):
+def fetch_source_entries(source_name, rss_url, limit=5, now_ts=None):
     """
-    Fetch RSS entries from multiple sources, prioritizing recent news.
+    Fetch and normalize entries from a single RSS source.
     Args:
-        sources (dict): Dictionary of source_name: rss_url
+        source_name (str): Display name of the source
+        rss_url (str): URL of the RSS feed
         limit (int): Maximum number of entries per source
-        max_age_hours (int): Maximum age of news in hours (default 2 hours)
+        now_ts (float, optional): Reference Unix time for entry ages (defaults to now)
     Returns:
-        list: List of recent news entries with metadata
+        list: News entries with metadata, empty on error
     """
-    all_entries = []
-    for source_name, rss_url in sources.items():
-        try:
-            logger.info(f"Fetching RSS from {source_name}: {rss_url}")
-            headers = {
-                'User-Agent': 'ChoyNewsBot/1.0 (+https://github.com/shanchoynoor/ChoyAI_News_Module)'
-            }
-            response = requests.get(rss_url, headers=headers, timeout=15)
-            response.raise_for_status()
-            feed = feedparser.parse(response.content)
-            if not feed.entries:
-                logger.warning(f"No entries found in RSS feed: {source_name}")
-                continue
-            logger.info(f"Found {len(feed.entries)} entries from {source_name}")
-            for entry in feed.entries[:limit*2]:
-                try:
-                    pub_time = (entry.get('published') or entry.get('updated') or entry.get('pubDate') or entry.get('date') or '')
-                    pub_time_dt = None
-                    time_ago = "Unknown"
-                    hours_diff = 999
-                    if hasattr(entry, 'published_parsed') and entry.published_parsed:
+    if now_ts is None:
+        now_ts = time.time()
+    entries = []
+    try:
+        logger.info(f"Fetching RSS from {source_name}: {rss_url}")
+        feed_entries = fetch_feed_entries(rss_url)
+        if not feed_entries:
+            logger.warning(f"No entries found in RSS feed: {source_name}")
+            return []
+        logger.info(f"Found {len(feed_entries)} entries from {source_name}")
+        for entry in feed_entries[:limit*2]:
+            try:
+                pub_time = (entry.get('published') or entry.get('updated') or entry.get('pubDate') or entry.get('date') or '')
+                time_ago = "Unknown"
+                hours_diff = 999
+                published_parsed = entry.get('published_parsed') or entry.get('updated_parsed')
+                if not published_parsed and pub_time:
+                    published_parsed = parse_date(pub_time)
+                if published_parsed:
+                    # published_parsed is a UTC struct_time; future times count as recent
+                    seconds_diff = abs(now_ts - calendar.timegm(published_parsed))
+                    hours_diff = seconds_diff / 3600
+                    time_ago = _format_time_ago(seconds_diff)
+                else:
+                    time_ago = get_hours_ago(pub_time)
+                    if "min ago" in time_ago:
                         try:
-                            import time
-                            pub_time_struct = entry.published_parsed
-                            pub_time_dt = datetime(*pub_time_struct[:6])
-                            now = datetime.now()
-                            time_diff = now - pub_time_dt
-                            hours_diff = time_diff.total_seconds() / 3600
-                            if hours_diff < 0:
-                                hours_diff = abs(hours_diff)
-                            if hours_diff < 1/60:
-                                time_ago = "now"
-                            elif hours_diff < 1:
-                                minutes_diff = int(time_diff.total_seconds() / 60)
-                                time_ago = f"{minutes_diff}min ago"
-                            elif hours_diff < 24:
-                                time_ago = f"{int(hours_diff)}hr ago"
-                            else:
-                                days_diff = int(hours_diff / 24)
-                                time_ago = f"{days_diff}d ago"
+                            hours_diff = int(time_ago.split("min")[0]) / 60
                         except:
-                            time_ago = get_hours_ago(pub_time)
-                            if "min ago" in time_ago:
-                                try:
-                                    hours_diff = int(time_ago.split("min")[0]) / 60
-                                except:
-                                    hours_diff = 0.5
-                            elif "hr ago" in time_ago:
-                                try:
-                                    hours_diff = int(time_ago.split("hr")[0])
-                                except:
-                                    hours_diff = 1
-                            elif "now" in time_ago:
-                                hours_diff = 0
-                    else:
-                        time_ago = get_hours_ago(pub_time)
-                        if "min ago" in time_ago:
-                            try:
-                                hours_diff = int(time_ago.split("min")[0]) / 60
-                            except:
-                                hours_diff = 0.5
-                        elif "hr ago" in time_ago:
-                            try:
-                                hours_diff = int(time_ago.split("hr")[0])
-                            except:
-                                hours_diff = 1
-                        elif "now" in time_ago:
-                            hours_diff = 0
-                        elif "d ago" in time_ago:
-                            hours_diff = 25
-                    title = entry.get('title', 'No title').strip()
-                    if len(title) > 100:
-                        title = title[:97] + "..."
-                    link = entry.get('link', '')
-                    entry_data = {
-                        'title': title,
-                        'link': link,
-                        'source': source_name,
-                        'published': pub_time,
-                        'time_ago': time_ago,
-                        'hours_diff': hours_diff,
-                        'summary': entry.get('summary', '')[:200] + "..." if entry.get('summary') else ''
-                    }
-                    all_entries.append(entry_data)
-                except Exception as e:
-                    logger.warning(f"Error processing entry from {source_name}: {e}")
-                    continue
-        except requests.RequestException as e:
-            logger.error(f"Error fetching RSS from {source_name}: {e}")
-            continue
-        except Exception as e:
-            logger.error(f"Unexpected error with {source_name}: {e}")
-            continue
+                            hours_diff = 0.5
+                    elif "hr ago" in time_ago:
+                        try:
+                            hours_diff = int(time_ago.split("hr")[0])
+                        except:
+                            hours_diff = 1
+                    elif "now" in time_ago:
+                        hours_diff = 0
+                    elif "d ago" in time_ago:
+                        hours_diff = 25
+                title = entry.get('title', 'No title').strip()
+                if len(title) > 100:
+                    title = title[:97] + "..."
+                link = entry.get('link', '')
+                entries.append(NewsEntry(
+                    title=title,
+                    link=link,
+                    source=source_name,
+                    published=pub_time,
+                    time_ago=time_ago,
+                    hours_diff=hours_diff,
+                    summary=entry.get('summary', '')[:200] + "..." if entry.get('summary') else ''
+                ))
+            except Exception as e:
+                logger.warning(f"Error processing entry from {source_name}: {e}")
+                continue
+    except requests.RequestException as e:
+        logger.error(f"Error fetching RSS from {source_name}: {e}")
+    except Exception as e:
+        logger.error(f"Unexpected error with {source_name}: {e}")
+    return entries
+
+def select_recent_entries(all_entries, limit=5):
+    """
+    Pick the most recent entries, preferring news from the last 30 minutes.
+    Args:
+        all_entries (list): News entries from one or more sources
+        limit (int): Maximum number of entries to return
+    Returns:
+        list: Selected entries, newest first
+    """
     # Sort all entries by publish time (newest first)
-    all_entries.sort(key=lambda x: x.get('hours_diff', 999))
+    all_entries = sorted(all_entries, key=attrgetter('hours_diff'))
     # Try to get only entries within 0.5 hours (30min)
-    recent_entries = [e for e in all_entries if e.get('hours_diff', 999) <= 0.5]
+    recent_entries = [e for e in all_entries if e.hours_diff <= 0.5]
     if recent_entries:
         return recent_entries[:limit]
     # If no recent entries, try to get entries within 2 hours
-    two_hour_entries = [e for e in all_entries if e.get('hours_diff', 999) <= 2]
+    two_hour_entries = [e for e in all_entries if e.hours_diff <= 2]
     if two_hour_entries:
         return two_hour_entries[:limit]
     # If still nothing, return the most recent available
     return all_entries[:limit]
 
+def fetch_rss_entries(sources, limit=5, max_age_hours=2):
+    """
+    Fetch RSS entries from multiple sources, prioritizing recent news.
+    Args:
+        sources (dict): Dictionary of source_name: rss_url
+        limit (int): Maximum number of entries per source
+        max_age_hours (int): Maximum age of news in hours (default 2 hours)
+    Returns:
+        list: List of recent news entries with metadata
+    """
+    now_ts = time.time()
+    futures = [
+        FEED_POOL.submit(fetch_source_entries, source_name, rss_url, limit, now_ts)
+        for source_name, rss_url in sources.items()
+    ]
+    all_entries = []
+    for future in futures:
+        all_entries.extend(future.result())
+    save_feed_cache()
+    return select_recent_entries(all_entries, limit)
+
+def fetch_all_categories(categories):
+    """
+    Fetch every feed of every category on the shared feed pool at once.
+    A story already selected for an earlier category (same link) is not
+    repeated in a later one.
+    Args:
+        categories (dict): category: {'sources': {...}, 'limit': int, 'max_age_hours': int}
+    Returns:
+        dict: category: list of selected news entries
+    """
+    now_ts = time.time()
+    futures = {
+        category: [
+            FEED_POOL.submit(fetch_source_entries, source_name, rss_url, config.get('limit', 5), now_ts)
+            for source_name, rss_url in config['sources'].items()
+        ]
+        for category, config in categories.items()
+    }
+    results = {}
+    seen_links = set()
+    for category, category_futures in futures.items():
+        all_entries = []
+        category_links = set()
+        for future in category_futures:
+            for entry in future.result():
+                if entry.link:
+                    if entry.link in seen_links or entry.link in category_links:
+                        continue
+                    category_links.add(entry.link)
+                all_entries.append(entry)
+        selected = select_recent_entries(all_entries, categories[category].get('limit', 5))
+        seen_links.update(entry.link for entry in selected if entry.link)
+        results[category] = selected
+    save_feed_cache()
+    return results
+
 def format_news(section_title, entries, limit=5):
     """
     Format news entries into markdown.
@@ -260,26 +325,84 @@ def format_news(section_title, entries, limit=5):
     if not entries:
         return f"*{section_title}*\nNo news available at the moment.\n\n"
     
-    formatted = f"*{section_title}*\n"
+    lines = [f"*{section_title}*"]
     
     for i, entry in enumerate(entries[:limit], 1):
-        title = entry.get('title', 'No title')
-        source = entry.get('source', 'Unknown')
-        time_ago = entry.get('time_ago', 'Unknown')
-        link = entry.get('link', '')
+        title = entry.title
+        source = entry.source
+        time_ago = entry.time_ago
+        link = entry.link
         
         # Escape markdown special characters in title
-        title_escaped = title.replace('*', '\\*').replace('_', '\\_').replace('[', '\\[').replace(']', '\\]')
+        title_escaped = escape_markdown(title)
         
         if link:
-            formatted += f"{i}. [{title_escaped}]({link}) - {source} ({time_ago})\n"
+            lines.append(f"{i}. [{title_escaped}]({link}) - {source} ({time_ago})")
         else:
-            formatted += f"{i}. {title_escaped} - {source} ({time_ago})\n"
+            lines.append(f"{i}. {title_escaped} - {source} ({time_ago})")
     
-    return formatted + "\n"
+    return "\n".join(lines) + "\n\n"
 
 # ===================== CATEGORY FETCHERS =====================
 
+# Feeds behind each section of the compact /news digest
+COMPACT_DIGEST_CATEGORIES = {
+    'local': {
+        'sources': {
+            "Prothom Alo": "https://en.prothomalo.com/rss",
+            "The Daily Star": "https://www.thedailystar.net/rss.xml",
+            "BDNews24": "https://bangla.bdnews24.com/feed/",
+            "Dhaka Tribune": "https://www.dhakatribune.com/feed",
+            "Kaler Kantho": "https://www.kalerkantho.com/rss.xml",
+            "Samakal": "https://samakal.com/rss.xml"
+        },
+        'limit': 8,
+        'max_age_hours': 6
+    },
+    'global': {
+        'sources': {
+            "BBC": "http://feeds.bbci.co.uk/news/rss.xml",
+            "CNN": "http://rss.cnn.com/rss/edition.rss",
+            "Reuters": "https://www.reutersagency.com/feed/?best-topics=top-news",
+            "Al Jazeera": "https://www.aljazeera.com/xml/rss/all.xml",
+            "New York Post": "https://nypost.com/feed/"
+        },
+        'limit': 8,
+        'max_age_hours': 6
+    },
+    'tech': {
+        'sources': {
+            "TechCrunch": "http://feeds.feedburner.com/TechCrunch/",
+            "The Verge": "https://www.theverge.com/rss/index.xml",
+            "Wired": "https://www.wired.com/feed/rss",
+            "CNET": "https://www.cnet.com/rss/news/"
+        },
+        'limit': 8,
+        'max_age_hours': 8
+    },
+    'sports': {
+        'sources': {
+            "ESPN": "https://www.espn.com/espn/rss/news",
+            "BBC Sport": "http://feeds.bbci.co.uk/sport/rss.xml?edition=uk",
+            "Sky Sports": "https://www.skysports.com/rss/12040",
+            "সমকাল খেলা": "https://samakal.com/sports/rss.xml",
+            "প্রথম আলো খেলা": "https://www.prothomalo.com/sports/feed"
+        },
+        'limit': 8,
+        'max_age_hours': 12
+    },
+    'finance': {
+        'sources': {
+            "Reuters Business": "https://www.reutersagency.com/feed/?best-topics=business",
+            "MarketWatch": "https://www.marketwatch.com/rss/topstories",
+            "প্রথম আলো অর্থনীতি": "https://www.prothomalo.com/business/feed",
+            "বণিক বার্তা": "https://www.bonikbarta.net/feed"
+        },
+        'limit': 8,
+        'max_age_hours': 8
+    }
+}
+
 def get_local_news():
     """Fetch local Bangladesh news."""
     bd_sources = {
@@ -357,103 +480,177 @@ def get_crypto_news():
 
 # ===================== CRYPTO DATA =====================
 
+# Magnitude suffixes for human_readable_number, largest first
+_NUMBER_SCALES = ((1e12, "T"), (1e9, "B"), (1e6, "M"), (1e3, "K"))
+
 def human_readable_number(num):
     """Convert large numbers to human readable format."""
     try:
         num = float(num)
-        if num >= 1e12:
-            return f"${num/1e12:.2f}T"
-        elif num >= 1e9:
-            return f"${num/1e9:.2f}B"
-        elif num >= 1e6:
-            return f"${num/1e6:.2f}M"
-        elif num >= 1e3:
-            return f"${num/1e3:.2f}K"
-        else:
-            return f"${num:.2f}"
     except:
         return str(num)
+    for scale, suffix in _NUMBER_SCALES:
+        if num >= scale:
+            return f"${num/scale:.2f}{suffix}"
+    return f"${num:.2f}"
 
-def fetch_crypto_market():
-    """Fetch cryptocurrency market overview."""
+# Last seen total market volume, kept next to the log file for the 24h volume change
+VOLUME_LOG_FILE = os.path.join(os.path.dirname(Config.LOG_FILE), "volume_log.json")
+
+# Every crypto market section starts from CoinGecko's global totals, so one
+# response is shared between them instead of each section fetching its own.
+@ttl_cache(seconds=60, persist=True)
+def fetch_global_market_totals():
+    """
+    Get the total crypto market cap and volume from CoinGecko.
+    Returns:
+        dict: market_cap and volume in USD, and market_change (24h market cap change in percent)
+    """
+    url = "https://api.coingecko.com/api/v3/global"
+    response = SESSION.get(url, timeout=DEFAULT_TIMEOUT)
+    response.raise_for_status()
+    
+    data = parse_json(response)["data"]
+    return {
+        "market_cap": data["total_market_cap"]["usd"],
+        "volume": data["total_volume"]["usd"],
+        "market_change": data["market_cap_change_percentage_24h_usd"],
+    }
+
+def _fetch_crypto_market_stats():
+    """
+    Fetch global crypto market totals and the Fear & Greed Index.
+    Returns:
+        dict: market_cap, market_change, volume, volume_change (None without a
+        previous reading) and fear_index (str, "N/A" if unavailable)
+    """
+    volume_file = VOLUME_LOG_FILE
+    os.makedirs(os.path.dirname(volume_file), exist_ok=True)
+    
+    totals = fetch_global_market_totals()
+    market_cap = totals["market_cap"]
+    volume = totals["volume"]
+    market_change = totals["market_change"]
+
+    # Calculate volume change
+    prev_volume = None
     try:
-        volume_file = os.path.join(Config.LOG_FILE.replace('choynews.log', ''), "volume_log.json")
-        os.makedirs(os.path.dirname(volume_file), exist_ok=True)
-        
-        url = "https://api.coingecko.com/api/v3/global"
-        response = requests.get(url, timeout=10)
-        response.raise_for_status()
-        
-        data = response.json()["data"]
-        market_cap = data["total_market_cap"]["usd"]
-        volume = data["total_volume"]["usd"]
-        market_change = data["market_cap_change_percentage_24h_usd"]
+        if os.path.exists(volume_file):
+            with open(volume_file, "r") as f:
+                prev_volume = json.load(f).get("volume", None)
+    except:
+        pass
 
-        # Calculate volume change
-        prev_volume = None
-        try:
-            if os.path.exists(volume_file):
-                with open(volume_file, "r") as f:
-                    prev_volume = json.load(f).get("volume", None)
-        except:
-            pass
+    if prev_volume and prev_volume > 0:
+        volume_change = ((volume - prev_volume) / prev_volume) * 100
+    else:
+        volume_change = None
 
-        if prev_volume and prev_volume > 0:
-            volume_change = ((volume - prev_volume) / prev_volume) * 100
-            volume_change_str = f"{volume_change:+.2f}%"
-        else:
-            volume_change_str = "N/A"
+    try:
+        with open(volume_file, "w") as f:
+            json.dump({"volume": volume}, f)
+    except:
+        pass
 
-        try:
-            with open(volume_file, "w") as f:
-                json.dump({"volume": volume}, f)
-        except:
-            pass
+    # Fetch Fear & Greed Index
+    try:
+        fear_response = SESSION.get("https://api.alternative.me/fng/?limit=1", timeout=(3, 5))
+        fear_index = parse_json(fear_response)["data"][0]["value"]
+    except:
+        fear_index = "N/A"
 
-        # Fetch Fear & Greed Index
-        try:
-            fear_response = requests.get("https://api.alternative.me/fng/?limit=1", timeout=5)
-            fear_index = fear_response.json()["data"][0]["value"]
-        except:
-            fear_index = "N/A"
+    return {
+        'market_cap': market_cap,
+        'market_change': market_change,
+        'volume': volume,
+        'volume_change': volume_change,
+        'fear_index': fear_index,
+    }
 
+def _format_volume_change(volume_change):
+    """Format the 24h volume change, or N/A without a previous reading."""
+    return f"{volume_change:+.2f}%" if volume_change is not None else "N/A"
+
+def fetch_crypto_market():
+    """Fetch cryptocurrency market overview."""
+    try:
+        stats = _fetch_crypto_market_stats()
         return (
             "*💰 CRYPTO MARKET:*\n"
-            f"Market Cap (24h): {human_readable_number(market_cap)} ({market_change:+.2f}%)\n"
-            f"Volume (24h): {human_readable_number(volume)} ({volume_change_str})\n"
-            f"Fear/Greed Index: {fear_index}/100\n\n"
+            f"Market Cap (24h): {human_readable_number(stats['market_cap'])} ({stats['market_change']:+.2f}%)\n"
+            f"Volume (24h): {human_readable_number(stats['volume'])} ({_format_volume_change(stats['volume_change'])})\n"
+            f"Fear/Greed Index: {stats['fear_index']}/100\n\n"
         )
     except Exception as e:
         logger.error(f"Error fetching crypto market data: {e}")
         return "*💰 CRYPTO MARKET:*\nMarket data temporarily unavailable.\n\n"
 
+def change_arrow(change):
+    """Get the ▲/▼/→ arrow for a positive, negative or zero change."""
+    return "▲" if change > 0 else "▼" if change < 0 else "→"
+
+def _format_price(price):
+    """Format a USD price with more decimals for smaller values."""
+    if price >= 1:
+        return f"${price:.2f}"
+    elif price >= 0.0001:
+        return f"${price:.4f}"
+    elif price >= 0.000001:
+        return f"${price:.6f}"
+    return f"${price:.8f}"
+
+def _format_mover(rank, coin):
+    """Format one line of the top gainers/losers list."""
+    name = coin.get('name', 'Unknown')
+    price_str = _format_price(coin.get('current_price', 0))
+    change = coin.get('price_change_percentage_24h', 0)
+    return f"{rank}. {name} {price_str} ({change:+.2f}%)"
+
+# CoinGecko ids shown in the big cap section
+BIG_CAP_IDS = ("bitcoin", "ethereum", "ripple", "binancecoin", "solana", "tron", "dogecoin", "cardano")
+
+# The top 100 markets list backs both the big cap and the top movers sections,
+# so one response is reused for a short while instead of fetched per section.
+@ttl_cache(seconds=60, persist=True)
+def _fetch_top_markets():
+    """Get CoinGecko's top 100 coins by market cap."""
+    url = "https://api.coingecko.com/api/v3/coins/markets"
+    params = {
+        "vs_currency": "usd", 
+        "order": "market_cap_desc", 
+        "per_page": 100,
+        "page": 1
+    }
+    response = SESSION.get(url, params=params, timeout=DEFAULT_TIMEOUT)
+    response.raise_for_status()
+    return parse_json(response)
+
+@ttl_cache(seconds=30)
+def _fetch_big_cap_markets():
+    """Get market data for BIG_CAP_IDS explicitly, for when one left the top 100."""
+    url = "https://api.coingecko.com/api/v3/coins/markets"
+    params = {"vs_currency": "usd", "ids": ",".join(BIG_CAP_IDS)}
+    response = SESSION.get(url, params=params, timeout=DEFAULT_TIMEOUT)
+    response.raise_for_status()
+    return parse_json(response)
+
 def fetch_big_cap_prices():
     """Fetch top cryptocurrency prices."""
-    ids = "bitcoin,ethereum,ripple,binancecoin,solana,tron,dogecoin,cardano"
     try:
-        url = "https://api.coingecko.com/api/v3/coins/markets"
-        params = {"vs_currency": "usd", "ids": ids}
-        response = requests.get(url, params=params, timeout=10)
-        response.raise_for_status()
+        data = [c for c in _fetch_top_markets() if c.get('id') in BIG_CAP_IDS]
+        if len(data) < len(BIG_CAP_IDS):
+            # A coin dropped out of the top 100, ask for the big caps explicitly
+            data = _fetch_big_cap_markets()
         
-        data = response.json()
-        msg = "*💎 Big Cap Crypto:*\n"
+        lines = ["*💎 Big Cap Crypto:*"]
         for c in data:
             price = c.get('current_price', 0)
             change = c.get('price_change_percentage_24h', 0)
             symbol = c.get('symbol', '').upper()
             
-            if price >= 1:
-                price_str = f"${price:.2f}"
-            elif price >= 0.0001:
-                price_str = f"${price:.4f}"
-            elif price >= 0.000001:
-                price_str = f"${price:.6f}"
-            else:
-                price_str = f"${price:.8f}"
-                
-            msg += f"{symbol}: {price_str} ({change:+.2f}%)\n"
-        return msg + "\n"
+            price_str = _format_price(price)
+            lines.append(f"{symbol}: {price_str} ({change:+.2f}%)")
+        return "\n".join(lines) + "\n\n"
     except Exception as e:
         logger.error(f"Error fetching big cap prices: {e}")
         return "*💎 Big Cap Crypto:*\nPrices temporarily unavailable.\n\n"
@@ -461,17 +658,7 @@ def fetch_big_cap_prices():
 def fetch_top_movers():
     """Fetch top crypto gainers and losers."""
     try:
-        url = "https://api.coingecko.com/api/v3/coins/markets"
-        params = {
-            "vs_currency": "usd", 
-            "order": "market_cap_desc", 
-            "per_page": 100,
-            "page": 1
-        }
-        response = requests.get(url, params=params, timeout=10)
-        response.raise_for_status()
-        
-        data = response.json()
+        data = _fetch_top_markets()
         
         # Filter out coins with null price changes
         valid_data = [c for c in data if c.get("price_change_percentage_24h") is not None]
@@ -479,138 +666,149 @@ def fetch_top_movers():
         gainers = sorted(valid_data, key=lambda x: x.get("price_change_percentage_24h", 0), reverse=True)[:5]
         losers = sorted(valid_data, key=lambda x: x.get("price_change_percentage_24h", 0))[:5]
 
-        msg = "*📈 Crypto Top 5 Gainers:*\n"
-        for i, c in enumerate(gainers, 1):
-            name = c.get('name', 'Unknown')
-            price = c.get('current_price', 0)
-            change = c.get('price_change_percentage_24h', 0)
-            
-            if price >= 1:
-                price_str = f"${price:.2f}"
-            elif price >= 0.0001:
-                price_str = f"${price:.4f}"
-            elif price >= 0.000001:
-                price_str = f"${price:.6f}"
-            else:
-                price_str = f"${price:.8f}"
-                
-            msg += f"{i}. {name} {price_str} ({change:+.2f}%)\n"
-
-        msg += "\n*📉 Crypto Top 5 Losers:*\n"
-        for i, c in enumerate(losers, 1):
-            name = c.get('name', 'Unknown')
-            price = c.get('current_price', 0)
-            change = c.get('price_change_percentage_24h', 0)
-            
-            if price >= 1:
-                price_str = f"${price:.2f}"
-            elif price >= 0.0001:
-                price_str = f"${price:.4f}"
-            elif price >= 0.000001:
-                price_str = f"${price:.6f}"
-            else:
-                price_str = f"${price:.8f}"
-                
-            msg += f"{i}. {name} {price_str} ({change:+.2f}%)\n"
-
-        return msg + "\n"
+        lines = ["*📈 Crypto Top 5 Gainers:*"]
+        lines.extend(_format_mover(i, c) for i, c in enumerate(gainers, 1))
+        lines.append("")
+        lines.append("*📉 Crypto Top 5 Losers:*")
+        lines.extend(_format_mover(i, c) for i, c in enumerate(losers, 1))
+        return "\n".join(lines) + "\n\n"
     except Exception as e:
         logger.error(f"Error fetching top movers: {e}")
         return "*📈📉 Top Movers:*\nData temporarily unavailable.\n\n"
 
 # ===================== WEATHER DATA =====================
 
+@ttl_cache(seconds=600, persist=True)
+def _fetch_weather_current(city):
+    """
+    Fetch current conditions for a city from WeatherAPI, reused for 10 minutes.
+    Args:
+        city (str): City name
+    Returns:
+        dict: The 'current' block of the response, or None if no API key is configured
+    """
+    api_key = Config.WEATHERAPI_KEY
+    if not api_key:
+        return None
+    
+    url = f"http://api.weatherapi.com/v1/current.json"
+    params = {
+        "key": api_key,
+        "q": city,
+        "aqi": "yes"
+    }
+    
+    response = SESSION.get(url, params=params, timeout=DEFAULT_TIMEOUT)
+    response.raise_for_status()
+    
+    return parse_json(response).get('current', {})
+
+def to_float(value):
+    """Convert a number or numeric string to float, or None if it is neither."""
+    if isinstance(value, bool):
+        return None
+    if isinstance(value, (int, float)):
+        return float(value)
+    if isinstance(value, str):
+        digits = value.strip()
+        if digits[:1] in ('+', '-'):
+            digits = digits[1:]
+        # isdecimal rather than isdigit: float() rejects superscripts like '²'
+        if digits.replace('.', '', 1).isdecimal():
+            return float(value)
+    return None
+
+# Upper bound (inclusive) of each UV index level; anything higher is Extreme
+_UV_BOUNDS = (2, 5, 7, 10)
+_UV_LEVELS = ("Low", "Moderate", "High", "Very High", "Extreme")
+
+def uv_level(uv):
+    """Get the WHO exposure level name for a numeric UV index."""
+    return _UV_LEVELS[bisect_left(_UV_BOUNDS, uv)]
+
+def _weather_fields(current):
+    """
+    Turn a WeatherAPI 'current' block into the display values used by the weather sections.
+    Args:
+        current (dict): The 'current' block of a WeatherAPI response
+    Returns:
+        dict: Display strings keyed by field name; 'uv_level' and 'uv_value' are None
+        when the UV index is missing or not numeric
+    """
+    temp_c = current.get('temp_c', 'N/A')
+    uv = current.get('uv', 'N/A')
+    visibility_km = current.get('vis_km', 'N/A')
+    
+    # Format UV Index properly
+    level = None
+    uv_value = to_float(uv)
+    if uv_value is not None:
+        level = "Minimal" if uv_value == 0 else uv_level(uv_value)
+        uv_display = f"{level} ({uv_value})"
+    elif uv != 'N/A':
+        uv_display = str(uv)
+    else:
+        uv_display = "N/A"
+    
+    # Air quality with value
+    aqi = current.get('air_quality', {})
+    us_epa_index = aqi.get('us-epa-index', 'N/A')
+    
+    aqi_levels = {1: "Good", 2: "Moderate", 3: "Unhealthy", 4: "Unhealthy", 5: "Very Unhealthy", 6: "Hazardous"}
+    aqi_text = aqi_levels.get(us_epa_index, "N/A")
+    if us_epa_index != 'N/A':
+        aqi_display = f"{aqi_text} ({us_epa_index})"
+    else:
+        aqi_display = "N/A"
+    
+    # Visibility with description for driving conditions
+    vis_value = to_float(visibility_km)
+    if vis_value is not None:
+        # Based on real-world driving visibility standards:
+        # - 5km+ is generally safe for normal driving
+        # - Below 5km requires caution and reduced speed
+        if vis_value >= 5:
+            vis_description = "clear"
+        else:
+            vis_description = "unclear"
+        vis_display = f"{visibility_km} km ({vis_description})"
+    elif visibility_km != 'N/A':
+        vis_display = f"{visibility_km} km"
+    else:
+        vis_display = "N/A"
+    
+    return {
+        'temp_c': temp_c,
+        'feels_like': current.get('feelslike_c', temp_c),
+        'condition': current.get('condition', {}).get('text', 'N/A'),
+        'humidity': current.get('humidity', 'N/A'),
+        'wind_kph': current.get('wind_kph', 'N/A'),
+        'wind_dir': current.get('wind_dir', 'N/A'),
+        'vis_display': vis_display,
+        'aqi_display': aqi_display,
+        'uv_display': uv_display,
+        'uv_level': level,
+        'uv_value': uv_value,
+    }
+
 def get_weather_data(city="Dhaka"):
     """Fetch weather data for a city."""
     try:
-        api_key = Config.WEATHERAPI_KEY
-        if not api_key:
+        current = _fetch_weather_current(city)
+        if current is None:
             return "☀️ WEATHER NOW\nWeather API key not configured.\n\n"
-            
-        url = f"http://api.weatherapi.com/v1/current.json"
-        params = {
-            "key": api_key,
-            "q": city,
-            "aqi": "yes"
-        }
-        
-        response = requests.get(url, params=params, timeout=10)
-        response.raise_for_status()
-        
-        data = response.json()
-        
-        current = data.get('current', {})
-        location = data.get('location', {})
-        
-        temp_c = current.get('temp_c', 'N/A')
-        condition = current.get('condition', {}).get('text', 'N/A')
-        humidity = current.get('humidity', 'N/A')
-        wind_kph = current.get('wind_kph', 'N/A')
-        wind_dir = current.get('wind_dir', 'N/A')
-        uv = current.get('uv', 'N/A')
-        visibility_km = current.get('vis_km', 'N/A')
-        
-        # Get additional weather data
-        feels_like = current.get('feelslike_c', temp_c)
-        
-        # Format UV Index properly
-        if uv != 'N/A':
-            try:
-                uv_value = float(uv)
-                if uv_value == 0:
-                    uv_display = f"Minimal ({uv_value})"
-                elif uv_value <= 2:
-                    uv_display = f"Low ({uv_value})"
-                elif uv_value <= 5:
-                    uv_display = f"Moderate ({uv_value})"
-                elif uv_value <= 7:
-                    uv_display = f"High ({uv_value})"
-                elif uv_value <= 10:
-                    uv_display = f"Very High ({uv_value})"
-                else:
-                    uv_display = f"Extreme ({uv_value})"
-            except:
-                uv_display = str(uv)
-        else:
-            uv_display = "N/A"
-        
-        # Air quality with value
-        aqi = current.get('air_quality', {})
-        us_epa_index = aqi.get('us-epa-index', 'N/A')
         
-        aqi_levels = {1: "Good", 2: "Moderate", 3: "Unhealthy", 4: "Unhealthy", 5: "Very Unhealthy", 6: "Hazardous"}
-        aqi_text = aqi_levels.get(us_epa_index, "N/A")
-        if us_epa_index != 'N/A':
-            aqi_display = f"{aqi_text} ({us_epa_index})"
-        else:
-            aqi_display = "N/A"
-        
-        # Visibility with description for driving conditions
-        if visibility_km != 'N/A':
-            try:
-                vis_value = float(visibility_km)
-                # Based on real-world driving visibility standards:
-                # - 5km+ is generally safe for normal driving
-                # - Below 5km requires caution and reduced speed
-                if vis_value >= 5:
-                    vis_description = "clear"
-                else:
-                    vis_description = "unclear"
-                vis_display = f"{visibility_km} km ({vis_description})"
-            except:
-                vis_display = f"{visibility_km} km"
-        else:
-            vis_display = "N/A"
+        fields = _weather_fields(current)
         
         weather_msg = (
             f"☀️ WEATHER\n"
-            f"🌡️ Temperature: {temp_c}°C - {feels_like}°C\n"
-            f"☁️ Condition: {condition}\n"
-            f"💧 Humidity: {humidity}%\n"
-            f"💨 Wind: {wind_kph} km/h {wind_dir}\n"
-            f"👁️ Visibility: {vis_display}\n"
-            f"🌬️ Air Quality: {aqi_display}\n"
-            f"☀️ UV Index: {uv_display}"
+            f"🌡️ Temperature: {fields['temp_c']}°C - {fields['feels_like']}°C\n"
+            f"☁️ Condition: {fields['condition']}\n"
+            f"💧 Humidity: {fields['humidity']}%\n"
+            f"💨 Wind: {fields['wind_kph']} km/h {fields['wind_dir']}\n"
+            f"👁️ Visibility: {fields['vis_display']}\n"
+            f"🌬️ Air Quality: {fields['aqi_display']}\n"
+            f"☀️ UV Index: {fields['uv_display']}"
         )
         
         return weather_msg
@@ -621,28 +819,55 @@ def get_weather_data(city="Dhaka"):
 
 # ===================== HOLIDAYS DATA =====================
 
+def _holiday_iso_date(holiday):
+    """Get the YYYY-MM-DD date of a Calendarific holiday."""
+    return holiday.get('date', {}).get('iso', '')[:10]
+
+# Holidays are fetched for a whole year at a time and looked up by date
+@ttl_cache(seconds=24 * 3600, persist=True)
+def _fetch_holiday_year(api_key, year):
+    """
+    Fetch a year of Bangladesh holidays from Calendarific.
+    Args:
+        api_key (str): Calendarific API key
+        year (int): Calendar year
+    Returns:
+        tuple: (sorted list of YYYY-MM-DD dates, holiday dicts in the same order)
+    """
+    url = "https://calendarific.com/api/v2/holidays"
+    params = {
+        "api_key": api_key,
+        "country": "BD",
+        "year": year
+    }
+    response = SESSION.get(url, params=params, timeout=DEFAULT_TIMEOUT)
+    response.raise_for_status()
+    holidays = parse_json(response).get('response', {}).get('holidays', [])
+    holidays = sorted(holidays, key=_holiday_iso_date)
+    return [_holiday_iso_date(h) for h in holidays], holidays
+
+def get_holidays_on(date):
+    """
+    Get the Bangladesh holidays falling on a date.
+    Args:
+        date (datetime): Day to look up
+    Returns:
+        list: Calendarific holiday dicts, empty if none or no API key is configured
+    Raises:
+        requests.RequestException: If the yearly holiday list cannot be fetched
+    """
+    api_key = Config.CALENDARIFIC_API_KEY
+    if not api_key:
+        return []
+    
+    dates, holidays = _fetch_holiday_year(api_key, date.year)
+    day = date.strftime('%Y-%m-%d')
+    return holidays[bisect_left(dates, day):bisect_right(dates, day)]
+
 def get_bd_holidays():
     """Fetch Bangladesh holidays for today."""
     try:
-        api_key = Config.CALENDARIFIC_API_KEY
-        if not api_key:
-            return ""
-            
-        today = datetime.now()
-        url = "https://calendarific.com/api/v2/holidays"
-        params = {
-            "api_key": api_key,
-            "country": "BD",
-            "year": today.year,
-            "month": today.month,
-            "day": today.day
-        }
-        
-        response = requests.get(url, params=params, timeout=10)
-        response.raise_for_status()
-        
-        data = response.json()
-        holidays = data.get('response', {}).get('holidays', [])
+        holidays = get_holidays_on(datetime.now())
         
         if holidays:
             holiday_names = [h.get('name', 'Holiday') for h in holidays]
@@ -753,6 +978,25 @@ def get_rsi_interpretation(rsi):
     else:
         return f"Bearish momentum"
 
+def _find_top_market(coin_symbol):
+    """
+    Look a coin up by symbol, id or name in the cached top 100 markets.
+    Args:
+        coin_symbol (str): Cryptocurrency symbol, id or name
+    Returns:
+        dict: The coin's market data, or None if it is not in the top 100
+    """
+    query = coin_symbol.lower()
+    try:
+        markets = _fetch_top_markets()
+    except Exception as e:
+        logger.debug(f"Top markets unavailable for coin lookup: {e}")
+        return None
+    for coin in markets:
+        if query in (coin.get('symbol', '').lower(), coin.get('id', '').lower(), coin.get('name', '').lower()):
+            return coin
+    return None
+
 def fetch_coin_detailed_stats(coin_symbol):
     """
     Fetch comprehensive cryptocurrency statistics and analysis.
@@ -764,51 +1008,55 @@ def fetch_coin_detailed_stats(coin_symbol):
         str: Formatted detailed analysis message
     """
     try:
-        # First get coin ID from symbol
-        search_url = "https://api.coingecko.com/api/v3/search"
-        search_params = {"query": coin_symbol}
-        search_response = requests.get(search_url, params=search_params, timeout=10)
-        
-        if search_response.status_code != 200:
-            return f"❌ Unable to find coin: {coin_symbol.upper()}"
-        
-        search_data = search_response.json()
-        
-        # Find the best match
-        coin_id = None
-        coin_name = None
-        
-        for coin in search_data.get('coins', []):
-            if (coin.get('symbol', '').lower() == coin_symbol.lower() or 
-                coin.get('id', '').lower() == coin_symbol.lower() or
-                coin.get('name', '').lower() == coin_symbol.lower()):
-                coin_id = coin.get('id')
-                coin_name = coin.get('name')
-                break
-        
-        if not coin_id:
-            return f"❌ Coin not found: {coin_symbol.upper()}"
+        # Coins in the top 100 are already in the cached markets list
+        coin = _find_top_market(coin_symbol)
+        if coin is None:
+            # First get coin ID from symbol
+            search_url = "https://api.coingecko.com/api/v3/search"
+            search_params = {"query": coin_symbol}
+            search_response = SESSION.get(search_url, params=search_params, timeout=DEFAULT_TIMEOUT)
+        
+            if search_response.status_code != 200:
+                return f"❌ Unable to find coin: {coin_symbol.upper()}"
+        
+            search_data = parse_json(search_response)
+        
+            # Find the best match
+            coin_id = None
+            coin_name = None
+        
+            for coin in search_data.get('coins', []):
+                if (coin.get('symbol', '').lower() == coin_symbol.lower() or 
+                    coin.get('id', '').lower() == coin_symbol.lower() or
+                    coin.get('name', '').lower() == coin_symbol.lower()):
+                    coin_id = coin.get('id')
+                    coin_name = coin.get('name')
+                    break
         
-        # Get detailed market data
-        market_url = "https://api.coingecko.com/api/v3/coins/markets"
-        market_params = {
-            "vs_currency": "usd",
-            "ids": coin_id,
-            "order": "market_cap_desc",
-            "per_page": 1,
-            "page": 1,
-            "sparkline": False,
-            "price_change_percentage": "1h,24h,7d,30d"
-        }
+            if not coin_id:
+                return f"❌ Coin not found: {coin_symbol.upper()}"
+        
+            # Get detailed market data
+            market_url = "https://api.coingecko.com/api/v3/coins/markets"
+            market_params = {
+                "vs_currency": "usd",
+                "ids": coin_id,
+                "order": "market_cap_desc",
+                "per_page": 1,
+                "page": 1,
+                "sparkline": False,
+                "price_change_percentage": "1h,24h,7d,30d"
+            }
         
-        market_response = requests.get(market_url, params=market_params, timeout=10)
-        market_response.raise_for_status()
-        market_data = market_response.json()
+            market_response = SESSION.get(market_url, params=market_params, timeout=DEFAULT_TIMEOUT)
+            market_response.raise_for_status()
+            market_data = parse_json(market_response)
         
-        if not market_data:
-            return f"❌ No market data available for {coin_symbol.upper()}"
+            if not market_data:
+                return f"❌ No market data available for {coin_symbol.upper()}"
         
-        coin = market_data[0]
+            coin = market_data[0]
+        coin_id = coin['id']
         
         # Get historical price data for technical analysis
         history_url = f"https://api.coingecko.com/api/v3/coins/{coin_id}/market_chart"
@@ -819,8 +1067,8 @@ def fetch_coin_detailed_stats(coin_symbol):
         }
         
         try:
-            history_response = requests.get(history_url, params=history_params, timeout=10)
-            history_data = history_response.json()
+            history_response = SESSION.get(history_url, params=history_params, timeout=DEFAULT_TIMEOUT)
+            history_data = parse_json(history_response)
             prices = [price[1] for price in history_data.get('prices', [])]
         except:
             prices = [coin.get('current_price', 0)] * 30  # Fallback
@@ -848,7 +1096,7 @@ def fetch_coin_detailed_stats(coin_symbol):
             price_str = f"${current_price:.8f}"
         
         # Direction indicator
-        direction = "▲" if price_change_24h > 0 else "▼" if price_change_24h < 0 else "→"
+        direction = change_arrow(price_change_24h)
         
         # Technical analysis
         rsi = calculate_rsi(prices)
@@ -936,43 +1184,20 @@ Bot Signal (Next 24h): {signal} → {signal_reason}"""
 def get_compact_weather():
     """Get compact weather format for news digest."""
     try:
-        weather_data = get_weather_data("Dhaka")
-        
-        # Extract key data from weather response
-        if "☀️ WEATHER" not in weather_data:
+        current = _fetch_weather_current("Dhaka")
+        if current is None:
             return "☀️ WEATHER\n🌡️ Data unavailable"
         
-        lines = weather_data.split('\n')
-        temp_line = ""
-        condition_line = ""
-        aqi_line = ""
-        uv_line = ""
-        
-        for line in lines:
-            if line.startswith('🌡️ Temperature:'):
-                # Extract temperature: "25.1°C - 30.1°C" -> "24.8°C"
-                temp_part = line.split(': ')[1].split(' - ')[0] if ': ' in line else "N/A"
-                temp_line = temp_part
-            elif line.startswith('☁️ Condition:'):
-                condition_line = line.split(': ')[1] if ': ' in line else "N/A"
-            elif line.startswith('🌬️ Air Quality:'):
-                # Extract AQI: "Moderate (2)" -> "(98)"
-                aqi_part = line.split(': ')[1] if ': ' in line else "N/A"
-                aqi_line = aqi_part
-            elif line.startswith('☀️ UV Index:'):
-                # Extract UV: "Low (1.2)" -> "Low (0.0/11)"
-                uv_part = line.split(': ')[1] if ': ' in line else "N/A"
-                if uv_part != "N/A" and "(" in uv_part:
-                    uv_value = uv_part.split('(')[1].split(')')[0]
-                    uv_level = uv_part.split('(')[0].strip()
-                    uv_line = f"{uv_level} ({uv_value}/11)"
-                else:
-                    uv_line = uv_part
+        fields = _weather_fields(current)
+        if fields['uv_level'] is not None:
+            uv_line = f"{fields['uv_level']} ({fields['uv_value']}/11)"
+        else:
+            uv_line = fields['uv_display']
         
         compact_weather = (
             f"☀️ WEATHER\n"
-            f"🌡️ {temp_line} | ☁️ {condition_line}\n"
-            f"🫧 Air: {aqi_line}\n"
+            f"🌡️ {fields['temp_c']}°C | ☁️ {fields['condition']}\n"
+            f"🫧 Air: {fields['aqi_display']}\n"
             f"🔆 UV: {uv_line}"
         )
         
@@ -985,34 +1210,22 @@ def get_compact_weather():
 def get_compact_crypto_market():
     """Get compact crypto market format for news digest."""
     try:
-        crypto_data = fetch_crypto_market()
-        
-        # Parse the crypto data to extract key values
-        lines = crypto_data.split('\n')
-        market_cap = "N/A"
-        volume = "N/A"
-        fear_greed = "N/A"
-        
-        for line in lines:
-            if "Market Cap" in line and "24h" in line:
-                # Extract: "Market Cap (24h): $3.75T (+0.35%)" -> "$3.75T (+0.35%)"
-                parts = line.split(': ')
-                if len(parts) > 1:
-                    market_cap = parts[1]
-            elif "Volume" in line and "24h" in line:
-                # Extract: "Volume (24h): $275.19B (+0.35%)" -> "$275.19B (+0.35%)"
-                parts = line.split(': ')
-                if len(parts) > 1:
-                    volume = parts[1]
-            elif "Fear/Greed Index" in line:
-                # Extract: "Fear/Greed Index: 71/100" -> "71/100"
-                parts = line.split(': ')
-                if len(parts) > 1:
-                    fear_greed = parts[1]
-        
-        # Determine trend symbol and sentiment
-        market_symbol = "▲" if "(+" in market_cap else "▼" if "(-" in market_cap else "→"
-        volume_symbol = "▲" if "(+" in volume else "▼" if "(-" in volume else "→"
+        try:
+            stats = _fetch_crypto_market_stats()
+        except Exception as e:
+            logger.error(f"Error fetching crypto market data: {e}")
+            stats = None
+        
+        if stats is not None:
+            market_cap = f"{human_readable_number(stats['market_cap'])} ({stats['market_change']:+.2f}%)"
+            volume = f"{human_readable_number(stats['volume'])} ({_format_volume_change(stats['volume_change'])})"
+            fear_greed = f"{stats['fear_index']}/100"
+            # Trend symbols straight from the numbers rather than the formatted text
+            market_symbol = change_arrow(stats['market_change'])
+            volume_symbol = change_arrow(stats['volume_change'] or 0)
+        else:
+            market_cap = volume = fear_greed = "N/A"
+            market_symbol = volume_symbol = "→"
         
         # Determine sentiment from Fear/Greed index
         try:
@@ -1054,25 +1267,51 @@ def get_compact_news_section(section_title, entries, limit=4, lang='en'):
     """
     if not entries:
         return f"{section_title}\nNo recent news available."
-    formatted = f"{section_title}\n"
+    lines = [section_title]
     for i, entry in enumerate(entries[:limit], 1):
         # For Bangla, use 'title_bn' if available, else fallback to 'title'
-        if lang == 'bn' and entry.get('title_bn'):
-            title = entry.get('title_bn', 'No title')
+        if lang == 'bn' and getattr(entry, 'title_bn', None):
+            title = entry.title_bn
         else:
-            title = entry.get('title', 'No title')
-        source = entry.get('source', 'Unknown')
-        time_ago = entry.get('time_ago', 'Unknown')
-        link = entry.get('link', '')
+            title = entry.title
+        source = entry.source
+        time_ago = entry.time_ago
+        link = entry.link
         # Truncate title if too long
         if len(title) > 80:
             title = title[:77] + "..."
         # Make title clickable if link available and add [Details]
         if link:
-            formatted += f"{i}. [{title}]({link}) - {source} ({time_ago}) [Details]\n"
+            lines.append(f"{i}. [{title}]({link}) - {source} ({time_ago}) [Details]")
+        else:
+            lines.append(f"{i}. {title} - {source} ({time_ago}) [Details]")
+    return "\n".join(lines) + "\n"
+
+def _build_news_items(entries, section, lang='en'):
+    """
+    Turn the first four entries of a digest section into button-ready news items.
+    Args:
+        entries (list): News entries of the section
+        section (str): Section key used in the item ids
+        lang (str): 'bn' to prefer Bangla titles when available
+    Returns:
+        list: Item dicts with id, title, link, source, time and summary keys
+    """
+    items = []
+    for idx, entry in enumerate(entries[:4]):
+        if lang == 'bn' and getattr(entry, 'title_bn', None):
+            title = entry.title_bn
         else:
-            formatted += f"{i}. {title} - {source} ({time_ago}) [Details]\n"
-    return formatted
+            title = entry.title
+        items.append({
+            'id': f'{section}_{idx}',
+            'title': title,
+            'link': entry.link,
+            'source': entry.source,
+            'time': entry.time_ago,
+            'summary': entry.summary
+        })
+    return items
 
 def get_compact_news_digest():
     """
@@ -1087,87 +1326,50 @@ def get_compact_news_digest():
         from utils.time_utils import get_bd_now, get_bd_time_str
         bd_now = get_bd_now()
         timestamp = get_bd_time_str(bd_now)
-        digest = f"📢 TOP NEWS HEADLINES\n{timestamp}\n"
-        holiday_info = get_bd_holidays().strip()
+        parts = [f"📢 TOP NEWS HEADLINES\n{timestamp}\n"]
+        # Every section is an independent network fetch, so run them together
+        # and wait for the slowest instead of the sum of all of them
+        results = run_concurrently([
+            ('holiday', get_bd_holidays),
+            ('news', lambda: fetch_all_categories(COMPACT_DIGEST_CATEGORIES)),
+            ('weather', get_compact_weather),
+            ('crypto_market', get_compact_crypto_market),
+        ])
+        holiday_info = results['holiday'].strip()
         if holiday_info:
-            digest += holiday_info + "\n"
-        digest += "\n"
-        # Fetch news entries first
-        local_entries = fetch_rss_entries({
-            "Prothom Alo": "https://en.prothomalo.com/rss",
-            "The Daily Star": "https://www.thedailystar.net/rss.xml",
-            "BDNews24": "https://bangla.bdnews24.com/feed/",
-            "Dhaka Tribune": "https://www.dhakatribune.com/feed",
-            "Kaler Kantho": "https://www.kalerkantho.com/rss.xml",
-            "Samakal": "https://samakal.com/rss.xml"
-        }, limit=8, max_age_hours=6)
-        global_entries = fetch_rss_entries({
-            "BBC": "http://feeds.bbci.co.uk/news/rss.xml",
-            "CNN": "http://rss.cnn.com/rss/edition.rss",
-            "Reuters": "https://www.reutersagency.com/feed/?best-topics=top-news",
-            "Al Jazeera": "https://www.aljazeera.com/xml/rss/all.xml",
-            "New York Post": "https://nypost.com/feed/"
-        }, limit=8, max_age_hours=6)
-        tech_entries = fetch_rss_entries({
-            "TechCrunch": "http://feeds.feedburner.com/TechCrunch/",
-            "The Verge": "https://www.theverge.com/rss/index.xml",
-            "Wired": "https://www.wired.com/feed/rss",
-            "CNET": "https://www.cnet.com/rss/news/"
-        }, limit=8, max_age_hours=8)
-        sports_entries = fetch_rss_entries({
-            "ESPN": "https://www.espn.com/espn/rss/news",
-            "BBC Sport": "http://feeds.bbci.co.uk/sport/rss.xml?edition=uk",
-            "Sky Sports": "https://www.skysports.com/rss/12040",
-            "সমকাল খেলা": "https://samakal.com/sports/rss.xml",
-            "প্রথম আলো খেলা": "https://www.prothomalo.com/sports/feed"
-        }, limit=8, max_age_hours=12)
-        finance_entries = fetch_rss_entries({
-            "Reuters Business": "https://www.reutersagency.com/feed/?best-topics=business",
-            "MarketWatch": "https://www.marketwatch.com/rss/topstories",
-            "প্রথম আলো অর্থনীতি": "https://www.prothomalo.com/business/feed",
-            "বণিক বার্তা": "https://www.bonikbarta.net/feed"
-        }, limit=8, max_age_hours=8)
+            parts.append(holiday_info + "\n")
+        parts.append("\n")
+        news = results['news']
+        local_entries = news['local']
+        global_entries = news['global']
+        tech_entries = news['tech']
+        sports_entries = news['sports']
+        finance_entries = news['finance']
         # Prepare section data for each news section
-        def build_news_items(entries, section, lang='en'):
-            items = []
-            for idx, entry in enumerate(entries[:4]):
-                if lang == 'bn' and entry.get('title_bn'):
-                    title = entry.get('title_bn', 'No title')
-                else:
-                    title = entry.get('title', 'No title')
-                items.append({
-                    'id': f'{section}_{idx}',
-                    'title': title,
-                    'link': entry.get('link', ''),
-                    'source': entry.get('source', 'Unknown'),
-                    'time': entry.get('time_ago', 'Unknown'),
-                    'summary': entry.get('summary', '')
-                })
-            return items
         section_data = [
-            {'title': '🇧🇩 LOCAL NEWS', 'command': '/local', 'news_items': build_news_items(local_entries, 'local', lang='bn')},
-            {'title': '🌍 GLOBAL NEWS', 'command': '/global', 'news_items': build_news_items(global_entries, 'global', lang='en')},
-            {'title': '🚀 TECH NEWS', 'command': '/tech', 'news_items': build_news_items(tech_entries, 'tech', lang='en')},
-            {'title': '🏆 SPORTS NEWS', 'command': '/sports', 'news_items': build_news_items(sports_entries, 'sports', lang='bn')},
-            {'title': '💼 FINANCE NEWS', 'command': '/finance', 'news_items': build_news_items(finance_entries, 'finance', lang='en')},
+            {'title': '🇧🇩 LOCAL NEWS', 'command': '/local', 'news_items': _build_news_items(local_entries, 'local', lang='bn')},
+            {'title': '🌍 GLOBAL NEWS', 'command': '/global', 'news_items': _build_news_items(global_entries, 'global', lang='en')},
+            {'title': '🚀 TECH NEWS', 'command': '/tech', 'news_items': _build_news_items(tech_entries, 'tech', lang='en')},
+            {'title': '🏆 SPORTS NEWS', 'command': '/sports', 'news_items': _build_news_items(sports_entries, 'sports', lang='bn')},
+            {'title': '💼 FINANCE NEWS', 'command': '/finance', 'news_items': _build_news_items(finance_entries, 'finance', lang='en')},
         ]
         # Compose digest text (no [Details] or [SEE MORE] in text)
-        digest += get_compact_weather() + "\n\n"
+        parts.append(results['weather'] + "\n\n")
         for section in section_data:
-            digest += f"{section['title']}\n"
+            parts.append(f"{section['title']}\n")
             for i, item in enumerate(section['news_items'], 1):
                 if item['link']:
-                    digest += f"{i}. [{item['title']}]({item['link']}) - {item['source']} ({item['time']})\n"
+                    parts.append(f"{i}. [{item['title']}]({item['link']}) - {item['source']} ({item['time']})\n")
                 else:
-                    digest += f"{i}. {item['title']} - {item['source']} ({item['time']})\n"
-            digest += "\n"
+                    parts.append(f"{i}. {item['title']} - {item['source']} ({item['time']})\n")
+            parts.append("\n")
         # Crypto market section
-        crypto_market = get_compact_crypto_market()
-        digest += crypto_market + "\n"
-        digest += "\n📌 Quick Navigation:\n"
-        digest += "Type /help for complete command list or the commands (e.g., /local, /global, /tech, /sports, /finance, /weather, /cryptostats, /btc, btcstats etc.)\n\n"
-        digest += "━━━━━━━━━━━━━━\n"
-        digest += "🤖 By Shanchoy Noor"
+        parts.append(results['crypto_market'] + "\n")
+        parts.append("\n📌 Quick Navigation:\n")
+        parts.append("Type /help for complete command list or the commands (e.g., /local, /global, /tech, /sports, /finance, /weather, /cryptostats, /btc, btcstats etc.)\n\n")
+        parts.append("━━━━━━━━━━━━━━\n")
+        parts.append("🤖 By Shanchoy Noor")
+        digest = "".join(parts)
         # Main category buttons for 2x3 grid
         main_buttons = [
             ("🇧🇩 LOCAL NEWS", "/local"),
@@ -1184,6 +1386,18 @@ def get_compact_news_digest():
 
 # ===================== EXISTING CRYPTO DATA =====================
 
+def _parse_minutes_ago(time_ago):
+    """Get the minutes from a 'Nmin ago'/'now' label; anything older counts as 999."""
+    if 'min' in time_ago:
+        try:
+            return int(time_ago.split('min')[0].strip())
+        except:
+            return 999
+    elif 'now' in time_ago:
+        return 0
+    else:
+        return 999
+
 def get_category_news(category, limit=10):
     """
     Get detailed news for a specific category.
@@ -1271,22 +1485,12 @@ def get_category_news(category, limit=10):
         if not entries:
             return f"{title}\nNo news available at the moment.", []
         # Filter for only recent news (<= 30 min ago)
-        def parse_minutes_ago(time_ago):
-            if 'min' in time_ago:
-                try:
-                    return int(time_ago.split('min')[0].strip())
-                except:
-                    return 999
-            elif 'now' in time_ago:
-                return 0
-            else:
-                return 999
         filtered_entries = []
         source_counts = {}
         for idx, entry in enumerate(entries):
-            mins = parse_minutes_ago(entry.get('time_ago', '999min ago'))
+            mins = _parse_minutes_ago(entry.time_ago)
             if mins <= 30:
-                source = entry.get('source', 'Unknown')
+                source = entry.source
                 count = source_counts.get(source, 0)
                 if count < 3:
                     filtered_entries.append((idx, entry))
@@ -1300,11 +1504,11 @@ def get_category_news(category, limit=10):
         response += "━━━━━━━━━━━━━━\n"
         news_items = []
         for i, (idx, entry) in enumerate(filtered_entries, 1):
-            title_text = entry.get('title', 'No title')
-            source = entry.get('source', 'Unknown')
-            time_ago = entry.get('time_ago', 'Unknown')
-            link = entry.get('link', '')
-            summary = entry.get('summary', '')
+            title_text = entry.title
+            source = entry.source
+            time_ago = entry.time_ago
+            link = entry.link
+            summary = entry.summary
             # Truncate title if too long
             if len(title_text) > 100:
                 title_text = title_text[:97] + "..."
@@ -1317,7 +1521,7 @@ def get_category_news(category, limit=10):
             # Prepare news_items for callback
             news_items.append({
                 'id': f'{category}_{idx}',
-                'title': entry.get('title', ''),
+                'title': entry.title,
                 'summary': summary,
                 'source': source
             })
@@ -1327,6 +1531,31 @@ def get_category_news(category, limit=10):
         logger.error(f"Error fetching {category} news: {e}")
         return f"❌ Error fetching {category} news. Please try again later.", []
 
+def _keyword_pattern(words):
+    """Compile a substring matcher that hits when any of the words occurs."""
+    return re.compile('|'.join(map(re.escape, words)))
+
+# Ordered category rules for analyze_news_item: first matching pattern wins
+NEWS_CATEGORY_RULES = (
+    (_keyword_pattern(['crypto', 'bitcoin', 'ethereum', 'blockchain', 'defi']),
+     "💰 Cryptocurrency/Finance", "Could affect crypto markets and digital asset prices"),
+    (_keyword_pattern(['war', 'conflict', 'military', 'attack', 'bomb']),
+     "⚔️ Conflict/Security", "May have geopolitical implications and market volatility"),
+    (_keyword_pattern(['economy', 'inflation', 'gdp', 'market', 'stock']),
+     "📈 Economic", "Likely to influence financial markets and economic indicators"),
+    (_keyword_pattern(['tech', 'ai', 'artificial intelligence', 'technology', 'startup']),
+     "🚀 Technology", "Could impact tech sector and innovation trends"),
+    (_keyword_pattern(['health', 'medical', 'vaccine', 'disease', 'hospital']),
+     "🏥 Healthcare", "May affect public health policies and medical sector"),
+    (_keyword_pattern(['election', 'political', 'government', 'policy', 'minister']),
+     "🏛️ Political", "Could influence political landscape and policy decisions"),
+    (_keyword_pattern(['sports', 'football', 'cricket', 'olympic', 'championship']),
+     "🏆 Sports", "Relevant for sports enthusiasts and related industries"),
+)
+URGENT_WORDS_RE = _keyword_pattern(['breaking', 'urgent', 'emergency', 'crisis', 'immediate', 'alert'])
+RECENT_WORDS_RE = _keyword_pattern(['today', 'now', 'just', 'latest'])
+LARGE_FIGURE_RE = _keyword_pattern(['billion', 'million', 'trillion'])
+
 def analyze_news_item(title, summary="", source=""):
     """
     Generate AI analysis for a specific news item.
@@ -1351,30 +1580,10 @@ def analyze_news_item(title, summary="", source=""):
         combined_text = f"{title_lower} {summary_lower}"
         
         # Category detection
-        if any(word in combined_text for word in ['crypto', 'bitcoin', 'ethereum', 'blockchain', 'defi']):
-            category = "💰 Cryptocurrency/Finance"
-            impact = "Could affect crypto markets and digital asset prices"
-        elif any(word in combined_text for word in ['war', 'conflict', 'military', 'attack', 'bomb']):
-            category = "⚔️ Conflict/Security"
-            impact = "May have geopolitical implications and market volatility"
-        elif any(word in combined_text for word in ['economy', 'inflation', 'gdp', 'market', 'stock']):
-            category = "📈 Economic"
-            impact = "Likely to influence financial markets and economic indicators"
-        elif any(word in combined_text for word in ['tech', 'ai', 'artificial intelligence', 'technology', 'startup']):
-            category = "🚀 Technology"
-            impact = "Could impact tech sector and innovation trends"
-        elif any(word in combined_text for word in ['health', 'medical', 'vaccine', 'disease', 'hospital']):
-            category = "🏥 Healthcare"
-            impact = "May affect public health policies and medical sector"
-        elif any(word in combined_text for word in ['election', 'political', 'government', 'policy', 'minister']):
-            category = "🏛️ Political"
-            impact = "Could influence political landscape and policy decisions"
-        elif any(word in combined_text for word in ['sports', 'football', 'cricket', 'olympic', 'championship']):
-            category = "🏆 Sports"
-            impact = "Relevant for sports enthusiasts and related industries"
-        else:
-            category = "📰 General News"
-            impact = "General interest with potential local/regional impact"
+        category, impact = next(
+            ((category, impact) for pattern, category, impact in NEWS_CATEGORY_RULES if pattern.search(combined_text)),
+            ("📰 General News", "General interest with potential local/regional impact")
+        )
         
         # Sentiment analysis (basic)
         positive_words = ['success', 'win', 'growth', 'improve', 'positive', 'gain', 'boost', 'rise']
@@ -1391,10 +1600,9 @@ def analyze_news_item(title, summary="", source=""):
             sentiment = "🟡 Neutral"
         
         # Urgency level
-        urgent_words = ['breaking', 'urgent', 'emergency', 'crisis', 'immediate', 'alert']
-        if any(word in combined_text for word in urgent_words):
+        if URGENT_WORDS_RE.search(combined_text):
             urgency = "🚨 High - Breaking news requiring immediate attention"
-        elif any(word in combined_text for word in ['today', 'now', 'just', 'latest']):
+        elif RECENT_WORDS_RE.search(combined_text):
             urgency = "⚡ Medium - Recent development worth monitoring"
         else:
             urgency = "📅 Normal - Regular news update"
@@ -1416,7 +1624,7 @@ def analyze_news_item(title, summary="", source=""):
         
         if 'government' in combined_text or 'minister' in combined_text:
             analysis += f"• Involves government/official entities\n"
-        if any(word in combined_text for word in ['billion', 'million', 'trillion']):
+        if LARGE_FIGURE_RE.search(combined_text):
             analysis += f"• Significant financial figures mentioned\n"
         
         analysis += f"\n💡 RECOMMENDATION:\n"
@@ -0,0 +1,100 @@
+"""
+RSS feed cache for the Choy News application.
+
+This module remembers the validators (ETag / Last-Modified), the parsed
+entries and the last fetch time of every feed so recently fetched feeds can
+be reused outright and unchanged feeds can be served from a conditional
+GET (304 Not Modified) without downloading or parsing them again.
+"""
+
+import os
+import json
+import threading
+import time
+
+from utils.logging import get_logger
+from utils.config import Config
+
+logger = get_logger(__name__)
+
+FEED_CACHE_FILE = os.path.join(Config.DATA_DIR, "cache", "feed_cache.json")
+
+_feeds = None
+_dirty = False
+_lock = threading.Lock()
+
+def _ensure_loaded():
+    """Load the cache file into memory once. Must be called with the lock held."""
+    global _feeds
+    if _feeds is not None:
+        return
+    try:
+        with open(FEED_CACHE_FILE, 'r') as f:
+            _feeds = json.load(f)
+        logger.debug(f"Loaded feed cache with {len(_feeds)} feeds")
+    except FileNotFoundError:
+        _feeds = {}
+    except Exception as e:
+        logger.error(f"Error loading feed cache from {FEED_CACHE_FILE}: {e}")
+        _feeds = {}
+
+def get_cached_feed(url):
+    """
+    Get the cached validators and entries for a feed.
+
+    Args:
+        url (str): Feed URL
+
+    Returns:
+        dict: {'etag', 'modified', 'entries', 'fetched_at'} or None if the feed is not cached
+    """
+    with _lock:
+        _ensure_loaded()
+        return _feeds.get(url)
+
+def update_cached_feed(url, etag, modified, entries):
+    """
+    Remember the validators and entries of a freshly downloaded feed.
+
+    Args:
+        url (str): Feed URL
+        etag (str): ETag response header, if any
+        modified (str): Last-Modified response header, if any
+        entries (list): JSON-serializable entry dicts
+    """
+    global _dirty
+    with _lock:
+        _ensure_loaded()
+        _feeds[url] = {'etag': etag, 'modified': modified, 'entries': entries, 'fetched_at': time.time()}
+        _dirty = True
+
+def mark_feed_fresh(url):
+    """
+    Record that a cached feed was just revalidated (304 Not Modified).
+
+    Args:
+        url (str): Feed URL
+    """
+    global _dirty
+    with _lock:
+        _ensure_loaded()
+        if url in _feeds:
+            _feeds[url]['fetched_at'] = time.time()
+            _dirty = True
+
+def save_feed_cache():
+    """Write the feed cache to disk if it changed since the last save."""
+    global _dirty
+    with _lock:
+        if not _dirty:
+            return
+        try:
+            os.makedirs(os.path.dirname(FEED_CACHE_FILE), exist_ok=True)
+            tmp_file = f"{FEED_CACHE_FILE}.tmp"
+            with open(tmp_file, 'w') as f:
+                json.dump(_feeds, f)
+            os.replace(tmp_file, FEED_CACHE_FILE)
+            _dirty = False
+            logger.debug(f"Feed cache saved to {FEED_CACHE_FILE}")
+        except Exception as e:
+            logger.error(f"Error saving feed cache to {FEED_CACHE_FILE}: {e}")
@@ -0,0 +1,91 @@
+"""
+Persistent API response cache for the Choy News application.
+
+This module stores the results of rate-limited upstream calls (weather,
+holidays, market data) in SQLite so a restarted bot can keep serving them
+until they expire instead of fetching everything again on startup.
+"""
+
+import os
+import json
+import sqlite3
+import threading
+import time
+
+from utils.logging import get_logger
+from utils.config import Config
+
+logger = get_logger(__name__)
+
+RESPONSE_CACHE_DB = os.path.join(Config.DATA_DIR, "cache", "response_cache.db")
+
+_initialized = False
+_lock = threading.Lock()
+
+def _connect():
+    """Open the cache database, creating it on first use. Must be called with the lock held."""
+    global _initialized
+    if not _initialized:
+        os.makedirs(os.path.dirname(RESPONSE_CACHE_DB), exist_ok=True)
+    conn = sqlite3.connect(RESPONSE_CACHE_DB)
+    if not _initialized:
+        conn.execute('''
+            CREATE TABLE IF NOT EXISTS responses (
+                key TEXT PRIMARY KEY,
+                value TEXT NOT NULL,
+                stored_at REAL NOT NULL
+            )
+        ''')
+        conn.commit()
+        _initialized = True
+    return conn
+
+def load_response(key, max_age):
+    """
+    Get a stored response if it is recent enough.
+
+    Args:
+        key (str): Cache key
+        max_age (float): Maximum age in seconds
+
+    Returns:
+        tuple: (stored_at, value) or None if missing, expired or unreadable
+    """
+    try:
+        with _lock:
+            conn = _connect()
+            try:
+                row = conn.execute(
+                    "SELECT value, stored_at FROM responses WHERE key = ?", (key,)
+                ).fetchone()
+            finally:
+                conn.close()
+    except Exception as e:
+        logger.error(f"Error reading response cache: {e}")
+        return None
+    if row is None or time.time() - row[1] >= max_age:
+        return None
+    return row[1], json.loads(row[0])
+
+def store_response(key, value):
+    """
+    Store a JSON-serializable response.
+
+    Args:
+        key (str): Cache key
+        value: Response to store
+    """
+    try:
+        payload = json.dumps(value)
+        with _lock:
+            conn = _connect()
+            try:
+                conn.execute(
+                    "INSERT OR REPLACE INTO responses (key, value, stored_at) VALUES (?, ?, ?)",
+                    (key, payload, time.time())
+                )
+                conn.commit()
+            finally:
+                conn.close()
+    except Exception as e:
+        logger.error(f"Error writing response cache: {e}")
@@ -4,8 +4,10 @@ Bot service module for Choy News Bot.
 This module handles Telegram bot messages and commands.
 """
 
+import os
 import logging
 import json
+import datetime
 from utils.logging import get_logger
 from data_modules.models import log_user_interaction
 
@@ -313,7 +315,6 @@ Type `/help` for more commands.
 def handle_server_command(chat_id):
     """Handle the /server command - show server/bot status."""
     from api.telegram import send_telegram
-    import datetime
     
     try:
         current_time = datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')
@@ -633,8 +634,6 @@ Thank you for using ChoyNewsBot! 🚀
 def handle_about_command(chat_id):
     """Handle the /about command."""
     from api.telegram import send_telegram
-    import json
-    import os
     
     try:
         # Load bot information from memory.json
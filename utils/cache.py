@@ -0,0 +1,103 @@
+"""
+Caching helpers for the Choy News application.
+
+This module provides a time-to-live memoizer for fetchers whose upstream
+data changes on the order of minutes or days, so bursts of bot commands are
+served from memory instead of hitting rate-limited APIs again.
+"""
+
+import hashlib
+import json
+import threading
+import time
+from functools import wraps
+
+from data_modules.response_cache import load_response, store_response
+
+def _persist_key(func, key):
+    """Build a stable cache key for a call; arguments are hashed since they may hold API keys."""
+    digest = hashlib.sha1(json.dumps(key, default=repr).encode()).hexdigest()
+    return f"{func.__module__}.{func.__qualname__}:{digest}"
+
+def ttl_cache(seconds, maxsize=128, persist=False, key=None):
+    """
+    Memoize a function's return value per argument tuple for a fixed time.
+
+    Exceptions are not cached, so a failed call is retried on the next use.
+    Concurrent callers with the same arguments wait for a single fetch
+    instead of all hitting the upstream API at once, while calls with
+    different arguments are fetched in parallel.
+
+    Args:
+        seconds (float): How long a result stays valid
+        maxsize (int): Maximum number of cached argument tuples
+        persist (bool): Also keep results in the on-disk response cache so
+            they survive restarts; results must be JSON-serializable, and
+            tuples come back as lists
+        key (callable, optional): Maps the call's arguments to the cache key,
+            e.g. to round inputs so near-identical calls share a result;
+            defaults to the arguments themselves
+
+    Returns:
+        callable: Decorator; the wrapped function gains a cache_clear() method
+    """
+    def decorator(func):
+        cache = {}
+        # Guards cache and key_locks; never held while func runs
+        lock = threading.Lock()
+        # Per-key [lock, number of callers using it], so only callers of the
+        # same key wait; an entry is dropped once its last caller is done
+        key_locks = {}
+
+        def lookup(cache_key):
+            """Get an unexpired cached result, or None. Must be called with lock held."""
+            cached = cache.get(cache_key)
+            if cached is not None and time.monotonic() - cached[0] < seconds:
+                return cached
+            return None
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            cache_key = key(*args, **kwargs) if key else (args, tuple(sorted(kwargs.items())))
+            with lock:
+                cached = lookup(cache_key)
+                if cached is not None:
+                    return cached[1]
+                entry = key_locks.setdefault(cache_key, [threading.Lock(), 0])
+                entry[1] += 1
+            try:
+                with entry[0]:
+                    with lock:
+                        # Another caller may have fetched it while we waited
+                        cached = lookup(cache_key)
+                    if cached is not None:
+                        return cached[1]
+                    stored = load_response(_persist_key(func, cache_key), seconds) if persist else None
+                    if stored is not None:
+                        stored_at, result = stored
+                        # Expire it in memory when it would have expired on disk
+                        cached_at = time.monotonic() - (time.time() - stored_at)
+                    else:
+                        result = func(*args, **kwargs)
+                        cached_at = time.monotonic()
+                        if persist:
+                            store_response(_persist_key(func, cache_key), result)
+                    with lock:
+                        if cache_key not in cache and len(cache) >= maxsize:
+                            # Drop the oldest entry to stay within maxsize
+                            del cache[min(cache, key=lambda k: cache[k][0])]
+                        cache[cache_key] = (cached_at, result)
+                    return result
+            finally:
+                with lock:
+                    entry[1] -= 1
+                    if not entry[1]:
+                        del key_locks[cache_key]
+
+        def cache_clear():
+            with lock:
+                cache.clear()
+
+        wrapper.cache_clear = cache_clear
+        return wrapper
+    return decorator
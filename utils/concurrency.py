@@ -0,0 +1,126 @@
+"""
+Concurrency helpers for the Choy News application.
+
+This module provides small wrappers around thread pools for running
+independent, network-bound fetchers at the same time.
+"""
+
+import threading
+from collections import defaultdict, deque
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from urllib.parse import urlparse
+
+from utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+# Shared pool for individual feed downloads across every news category.
+# Jobs submitted here must not wait on other jobs in the same pool.
+FEED_POOL = ThreadPoolExecutor(max_workers=32, thread_name_prefix='feed')
+
+# Maximum number of simultaneous requests to a single host
+PER_HOST_LIMIT = 4
+
+_host_semaphores = defaultdict(lambda: threading.BoundedSemaphore(PER_HOST_LIMIT))
+_host_semaphores_lock = threading.Lock()
+
+def run_concurrently(tasks, max_workers=None):
+    """
+    Run independent callables in parallel and collect their results by key.
+
+    Args:
+        tasks (list): List of (key, callable) tuples; callables take no arguments
+        max_workers (int, optional): Thread count (defaults to one per task)
+
+    Returns:
+        dict: Mapping of key to the callable's return value
+
+    Raises:
+        Exception: Re-raises the first exception raised by any task
+    """
+    if not tasks:
+        return {}
+
+    results = {}
+    with ThreadPoolExecutor(max_workers=max_workers or len(tasks)) as executor:
+        futures = {executor.submit(func): key for key, func in tasks}
+        for future in as_completed(futures):
+            results[futures[future]] = future.result()
+    return results
+
+@contextmanager
+def host_slot(url):
+    """
+    Limit how many threads talk to the host of a URL at the same time.
+
+    Args:
+        url (str): URL whose host should be throttled
+    """
+    host = urlparse(url).netloc
+    with _host_semaphores_lock:
+        semaphore = _host_semaphores[host]
+    with semaphore:
+        yield
+
+class KeyedDispatcher:
+    """
+    Run jobs on a thread pool, in submission order and one at a time per key.
+
+    Jobs with different keys (e.g. different Telegram chats) run in parallel,
+    while jobs sharing a key never overlap and never run out of order.
+    """
+
+    def __init__(self, max_workers, max_pending, thread_name_prefix=''):
+        """
+        Args:
+            max_workers (int): Maximum number of keys served at the same time
+            max_pending (int): Maximum number of queued and running jobs;
+                submit() blocks while this many are outstanding
+            thread_name_prefix (str, optional): Name prefix for the pool threads
+        """
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix=thread_name_prefix)
+        self._queues = {}
+        self._lock = threading.Lock()
+        self._slots = threading.BoundedSemaphore(max_pending)
+
+    def submit(self, key, func, *args):
+        """
+        Queue func(*args) behind any pending jobs for the same key.
+
+        Blocks while max_pending jobs are outstanding, so a slow consumer
+        holds up the producer instead of letting the backlog grow.
+
+        Args:
+            key: Hashable key jobs are serialized on
+            func (callable): Job to run
+        """
+        self._slots.acquire()
+        with self._lock:
+            queue = self._queues.get(key)
+            if queue is not None:
+                # A worker is already draining this key and will pick the job up
+                queue.append((func, args))
+                return
+            self._queues[key] = deque([(func, args)])
+        self._pool.submit(self._drain, key)
+
+    def _drain(self, key):
+        """Run the queued jobs of a key until none are left."""
+        while True:
+            with self._lock:
+                queue = self._queues[key]
+                if not queue:
+                    del self._queues[key]
+                    return
+                func, args = queue.popleft()
+            try:
+                func(*args)
+            except Exception as e:
+                logger.error(f"Error in dispatched job for {key}: {e}", exc_info=True)
+            finally:
+                self._slots.release()
+
+    def shutdown(self):
+        """Wait for every queued job to finish, then stop the worker threads."""
+        self._pool.shutdown(wait=True)
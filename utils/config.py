@@ -5,18 +5,12 @@ Configuration management for the Choy News application.
 import os
 from dotenv import load_dotenv
 
-# Load environment variables from .env file
+# Load environment variables from the project's .env file; a no-op if there is none
 load_dotenv()
 
 class Config:
     """Configuration class for the Choy News Bot."""
 
-    # Load environment variables from .env file if it exists
-    env_file = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), '.env')
-    if os.path.exists(env_file):
-        from dotenv import load_dotenv
-        load_dotenv(env_file)
-
     # Telegram Bot Configuration
     TELEGRAM_TOKEN = os.getenv('TELEGRAM_BOT_TOKEN', '')
 
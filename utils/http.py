@@ -0,0 +1,76 @@
+"""
+Shared HTTP client for the Choy News application.
+
+This module provides pooled requests sessions so repeated calls to the same
+hosts (Telegram, CoinGecko, RSS providers) reuse keep-alive connections
+instead of paying a new TCP and TLS handshake on every request.
+"""
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+except ImportError:  # Optional speedup, fall back to the stdlib decoder
+    orjson = None
+
+# (connect, read) timeout used when a caller has no specific requirement
+DEFAULT_TIMEOUT = (3, 10)
+
+DEFAULT_HEADERS = {
+    'User-Agent': 'ChoyNewsBot/1.0 (+https://github.com/shanchoynoor/ChoyAI_News_Module)',
+    'Accept-Encoding': 'gzip, deflate',
+}
+
+def _build_session(pool_connections, pool_maxsize, max_retries):
+    """
+    Create a requests session with a pooled adapter mounted for HTTP and HTTPS.
+
+    Args:
+        pool_connections (int): Number of per-host connection pools to cache
+        pool_maxsize (int): Maximum number of connections kept per host
+        max_retries (Retry or int): Retry policy for failed connections
+
+    Returns:
+        requests.Session: Configured session
+    """
+    session = requests.Session()
+    session.headers.update(DEFAULT_HEADERS)
+    adapter = HTTPAdapter(
+        pool_connections=pool_connections,
+        pool_maxsize=pool_maxsize,
+        max_retries=max_retries
+    )
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+# General purpose session for API calls and RSS feeds. Read errors are not
+# retried so a slow feed cannot stall a caller for several timeouts in a row.
+SESSION = _build_session(
+    pool_connections=20,
+    pool_maxsize=50,
+    max_retries=Retry(total=3, read=0, backoff_factor=0.3)
+)
+
+# Dedicated session for Telegram long polling so a held getUpdates connection
+# never occupies a slot needed by outgoing messages.
+POLL_SESSION = _build_session(pool_connections=1, pool_maxsize=1, max_retries=0)
+
+def parse_json(response):
+    """
+    Decode the JSON body of a response, using orjson when it is installed.
+
+    Args:
+        response (requests.Response): Response with a JSON body
+
+    Returns:
+        The decoded JSON document
+
+    Raises:
+        ValueError: If the body is not valid JSON
+    """
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
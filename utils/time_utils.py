@@ -7,13 +7,19 @@ and scheduling logic based on time conditions.
 
 import sqlite3
 from datetime import datetime, timedelta, timezone
-from pytz import timezone as pytz_timezone, all_timezones
+from functools import lru_cache
+from pytz import timezone as pytz_timezone, all_timezones, utc as pytz_utc
 from timezonefinder import TimezoneFinder
 from .config import Config
 from .logging import setup_logging
 
 logger = setup_logging(__name__)
 
+@lru_cache(maxsize=1)
+def _timezone_finder():
+    """Get the shared TimezoneFinder (loading its shape data is slow)."""
+    return TimezoneFinder()
+
 def get_bd_now():
     """Get current time in Bangladesh timezone (UTC+6)."""
     return datetime.now(timezone.utc) + timedelta(hours=6)
@@ -184,8 +190,7 @@ def get_local_time_str(user_location=None, user_id=None):
             lat = user_location.get("latitude")
             lon = user_location.get("longitude")
             if lat and lon:
-                tf = TimezoneFinder()
-                tz_str = tf.timezone_at(lng=lon, lat=lat)
+                tz_str = _timezone_finder().timezone_at(lng=lon, lat=lat)
         
         # Default to Dhaka if no timezone specified
         if not tz_str:
@@ -195,9 +200,7 @@ def get_local_time_str(user_location=None, user_id=None):
         local_tz = pytz_timezone(tz_str)
         
         # Get current time in UTC and convert to the local timezone
-        utc_now = datetime.utcnow()
-        utc_now = pytz_timezone('UTC').localize(utc_now)
-        local_now = utc_now.astimezone(local_tz)
+        local_now = datetime.now(pytz_utc).astimezone(local_tz)
         
         # Format: Jul 7, 2025 8:38PM
         date_str = local_now.strftime("%b %-d, %Y %-I:%M%p")
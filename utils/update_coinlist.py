@@ -8,7 +8,6 @@ and saves it to the coinlist.json file used by the bot.
 
 import os
 import json
-import requests
 import logging
 from datetime import datetime
 
@@ -18,6 +17,7 @@ sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')
 
 from utils.logging import setup_logging
 from utils.config import Config
+from utils.http import SESSION, parse_json
 from data_modules.crypto_cache import save_coinlist
 
 logger = setup_logging(__name__)
@@ -33,10 +33,10 @@ def fetch_coinlist():
     
     try:
         url = "https://api.coingecko.com/api/v3/coins/list"
-        response = requests.get(url, timeout=30)
+        response = SESSION.get(url, timeout=30)
         response.raise_for_status()
         
-        coins = response.json()
+        coins = parse_json(response)
         logger.info(f"Fetched {len(coins)} coins from CoinGecko API")
         
         # Convert to dict with symbol as key